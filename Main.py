@@ -3,61 +3,236 @@ Main entry point for generating 1, 5, and 10-year 10-K style projection reports.
 (Version 2 - Improved)
 """
 
+import os
 import sys
+import atexit
 import logging
-import argparse
-from typing import Dict, Any, Optional # Added Optional
-from pathlib import Path
-import traceback # For more detailed error logging
+import logging.handlers
+import multiprocessing
+from typing import Dict, Any, List, Optional, Tuple, TYPE_CHECKING # Added Optional
+from types import SimpleNamespace
+import hashlib
+import json
+import dataclasses
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
 
 # Simplified imports
-from src.core.config import get_config, BASELINE_DATA, GROWTH_ASSUMPTIONS
+from src.core.config import GROWTH_ASSUMPTIONS, GROWTH_TIMEFRAMES, TIMEFRAMES, TIMEFRAME_LABELS, CACHE_DIR, CACHE_TTL_SECONDS
 from src.core.baseline import get_baseline_data
-from src.analysis.quantitative_model import calculate_10k_projections # Main calculation function
-from src.reports.report_generator import ReportGenerator, ReportGenerationError, ReportRenderingError # Import specific errors
+from src.core.cache import FileCache
+# Calculation and report modules (NumPy/ReportLab) are imported in run_report_generation
+if TYPE_CHECKING:
+    from src.reports.report_generator import ReportGenerator
 
-# Configure basic logging
+# Configure logging
 # Consider adding timestamps to log file names if running frequently
 log_file = '10k_generator.log'
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_file),
-        logging.StreamHandler(sys.stdout) # Keep console output
-    ]
-)
 # Separate logger for this module
 logger = logging.getLogger(__name__)
+# Set by _setup_logging; passed to the render workers so their records reach the same listener
+_log_queue: Optional['multiprocessing.Queue'] = None
 
-def parse_arguments() -> argparse.Namespace:
-    """Parse command line arguments."""
-    parser = argparse.ArgumentParser(description='BFC 10-K Style Projection Report Generator')
-    parser.add_argument(
-        '--output-dir',
-        type=str,
-        default='./outputs',
-        help='Directory for output PDF files (Default: ./outputs)'
-    )
-    # No other arguments needed for this focused version
-    return parser.parse_args()
-
-def run_report_generation(args: argparse.Namespace) -> None:
+def _setup_logging() -> None:
+    """
+    Routes logging through a queue: logging calls only enqueue records, and a background listener
+    thread does the file/console I/O. Called from main() rather than at import, so a spawned worker
+    re-importing this module does not open the log file or start a listener of its own.
+    """
+    global _log_queue
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler(log_file)
+    file_handler.setFormatter(formatter)
+    console_handler = logging.StreamHandler(sys.stdout) # Keep console output
+    console_handler.setFormatter(formatter)
+
+    # A multiprocessing queue so records from the report worker processes reach the same listener;
+    # created from the pool's start-method context, which it is shared with
+    _log_queue = _render_context().Queue(-1)
+    logging.getLogger().setLevel(logging.INFO)
+    logging.getLogger().addHandler(logging.handlers.QueueHandler(_log_queue))
+    log_listener = logging.handlers.QueueListener(_log_queue, file_handler, console_handler)
+    log_listener.start()
+    atexit.register(log_listener.stop)
+
+_USAGE = "usage: Main.py [-h] [--output-dir OUTPUT_DIR]"
+_HELP = f"""{_USAGE}
+
+BFC 10-K Style Projection Report Generator
+
+options:
+  -h, --help            show this help message and exit
+  --output-dir OUTPUT_DIR
+                        Directory for output PDF files (Default: ./outputs)
+"""
+
+def _usage_error(message: str) -> None:
+    """Prints an argparse-style usage error and exits with status 2."""
+    print(f"{_USAGE}\nMain.py: error: {message}", file=sys.stderr)
+    sys.exit(2)
+
+def parse_arguments(argv: Optional[List[str]] = None) -> SimpleNamespace:
+    """Parse command line arguments (only --output-dir, so argparse is not needed)."""
+    argv = sys.argv[1:] if argv is None else argv
+    output_dir = './outputs'
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg in ('-h', '--help'):
+            print(_HELP, end='')
+            sys.exit(0)
+        elif arg == '--output-dir':
+            if i + 1 >= len(argv):
+                _usage_error("argument --output-dir: expected one argument")
+            output_dir = argv[i + 1]
+            i += 1
+        elif arg.startswith('--output-dir='):
+            output_dir = arg.split('=', 1)[1]
+        else:
+            _usage_error(f"unrecognized arguments: {' '.join(argv[i:])}")
+        i += 1
+    return SimpleNamespace(output_dir=output_dir)
+
+# Resolved output directories keyed by the path string given on the command line
+_RESOLVED_OUTPUT: Dict[str, str] = {}
+
+def _ensure_output_dir(path: str) -> str:
+    """Creates the output directory if needed and returns its resolved path (cached per input path)."""
+    resolved = _RESOLVED_OUTPUT.get(path)
+    if resolved is None:
+        os.makedirs(path, exist_ok=True)
+        resolved = _RESOLVED_OUTPUT[path] = os.path.realpath(path)
+    return resolved
+
+# Modules whose code produces the cached projections and PDFs (all imported by run_report_generation)
+_CACHED_OUTPUT_MODULES = ('src.core.config', 'src.analysis.quantitative_model', 'src.reports.report_generator')
+
+def _source_digest() -> str:
+    """md5 of the source of _CACHED_OUTPUT_MODULES, so editing any of them invalidates the cache."""
+    digest = hashlib.md5()
+    for name in _CACHED_OUTPUT_MODULES:
+        with open(sys.modules[name].__file__, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+def _pack_projections(projection_data: Dict[str, Any], timeframes: List[str]):
+    """
+    Splits per-timeframe projections into a float64 matrix (rows = timeframes) plus
+    per-timeframe {field: column} maps and the non-numeric values (e.g. 'N/A' CAGR strings).
+    """
+    import numpy as np
+    fields: List[str] = []
+    for timeframe in timeframes:
+        fields.extend(k for k in projection_data[timeframe] if k not in fields)
+    matrix = np.full((len(timeframes), len(fields)), np.nan, dtype=np.float64)
+    columns: Dict[str, Dict[str, int]] = {}
+    non_numeric: Dict[str, Dict[str, Any]] = {}
+    for row, timeframe in enumerate(timeframes):
+        columns[timeframe], non_numeric[timeframe] = {}, {}
+        for field, value in projection_data[timeframe].items():
+            if isinstance(value, (int, float)):
+                col = fields.index(field)
+                matrix[row, col] = value
+                columns[timeframe][field] = col
+            else:
+                non_numeric[timeframe][field] = value
+    return matrix, columns, non_numeric
+
+# Set in each render worker by _init_render_worker
+_worker_report_gen: Optional['ReportGenerator'] = None
+
+def _init_render_worker(report_gen: 'ReportGenerator', log_queue: Optional['multiprocessing.Queue']) -> None:
+    """
+    Pool initializer: keeps the parent's ReportGenerator for every task in this worker.
+    Under fork it is inherited without pickling; under spawn it is rebuilt once per worker,
+    which also imports ReportLab before the first task arrives.
+    Records are sent to the parent's log listener (a spawned worker starts with no handlers).
+    """
+    global _worker_report_gen
+    _worker_report_gen = report_gen
+    if log_queue is not None:
+        root = logging.getLogger()
+        root.handlers[:] = [logging.handlers.QueueHandler(log_queue)] # Replaces the copy inherited under fork
+        root.setLevel(logging.INFO)
+
+def _render_context():
+    """fork where available, so workers start with ReportLab and the config already imported."""
+    return multiprocessing.get_context('fork' if 'fork' in multiprocessing.get_all_start_methods() else 'spawn')
+
+def _render_from_shared(timeframe: str, baseline: Dict[str, Any],
+                        shm_name: str, shape: Tuple[int, int], dtype: str, row: int,
+                        columns: Dict[str, int], non_numeric: Dict[str, Any]) -> str:
+    """Worker task: rebuilds one timeframe's projections from the shared matrix and renders its report."""
+    import numpy as np
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        matrix = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+        projections = {field: float(matrix[row, col]) for field, col in columns.items()}
+        del matrix # Release the buffer before closing the segment
+    finally:
+        shm.close()
+    projections.update(non_numeric)
+    return _worker_report_gen.render_one(timeframe, {'baseline': baseline, timeframe: projections})
+
+def _render_reports(report_gen: 'ReportGenerator', projection_data: Dict[str, Any]) -> Dict[str, str]:
+    """Renders each timeframe report in its own process; returns {timeframe: path or 'FAILED: ...'}."""
+    # PDF layout is CPU-bound and holds the GIL, so render each timeframe in its own process.
+    # The numeric projections are placed in shared memory once; each worker attaches by name and
+    # reads its own row instead of receiving a pickled copy.
+    import numpy as np
+    timeframes = [tf for tf in TIMEFRAMES if tf in projection_data]
+    matrix, columns, non_numeric = _pack_projections(projection_data, timeframes)
+    generated_paths: Dict[str, str] = {}
+    shm = shared_memory.SharedMemory(create=True, size=max(matrix.nbytes, 1))
+    try:
+        shared = np.ndarray(matrix.shape, dtype=matrix.dtype, buffer=shm.buf)
+        shared[:] = matrix
+        del shared
+        with ProcessPoolExecutor(max_workers=3, mp_context=_render_context(),
+                                 initializer=_init_render_worker, initargs=(report_gen, _log_queue)) as executor:
+            future_to_timeframe = {
+                executor.submit(_render_from_shared, timeframe, projection_data['baseline'],
+                                shm.name, matrix.shape, matrix.dtype.str, row,
+                                columns[timeframe], non_numeric[timeframe]): timeframe
+                for row, timeframe in enumerate(timeframes)
+            }
+            for future in as_completed(future_to_timeframe):
+                timeframe = future_to_timeframe[future]
+                try:
+                    generated_paths[timeframe] = future.result()
+                except Exception as e:
+                    logger.error(f"Report generation failed for timeframe '{timeframe}': {e}", exc_info=True)
+                    generated_paths[timeframe] = f"FAILED: {type(e).__name__}"
+    finally:
+        shm.close()
+        shm.unlink()
+    return generated_paths
+
+def run_report_generation(args: SimpleNamespace) -> None:
     """
     Runs the 10-K report generation process with enhanced error handling.
     """
+    # Deferred so that --help and argument errors return without loading NumPy/ReportLab
+    try:
+        from src.analysis.quantitative_model import calculate_10k_projections # Main calculation function
+        from src.reports.report_generator import ReportGenerator, ReportGenerationError, ReportRenderingError # Import specific errors
+    except ImportError as e:
+        # The report error types live in the module that failed, so this is handled before the main try
+        logger.error(f"Could not load the calculation/report modules: {e}")
+        logger.debug("Traceback:", exc_info=True)
+        print(f"\nERROR: Missing dependency ({e}). Check log file '{log_file}' for details.", file=sys.stderr)
+        sys.exit(1)
+
     try:
         logger.info("="*50)
         logger.info("Starting 10-K projection report generation process...")
 
         # --- Configuration and Setup ---
-        config = get_config() # Load config if needed (e.g., for log level from env)
-        output_dir = Path(args.output_dir)
         try:
-            output_dir.mkdir(parents=True, exist_ok=True)
-            logger.info(f"Output directory set to: {output_dir.resolve()}")
+            output_dir = _ensure_output_dir(args.output_dir)
+            logger.info(f"Output directory set to: {output_dir}")
         except OSError as e:
-            logger.error(f"Failed to create output directory '{output_dir}': {e}")
+            logger.error(f"Failed to create output directory '{args.output_dir}': {e}")
             raise ReportGenerationError(f"Cannot create output directory: {e}") from e
 
         # --- Data Loading ---
@@ -66,19 +241,40 @@ def run_report_generation(args: argparse.Namespace) -> None:
         baseline_data = get_baseline_data()
         logger.info("Baseline data loaded.")
 
-        # --- Calculations ---
-        logger.info("Calculating financial projections...")
-        # calculate_10k_projections should handle missing keys gracefully or raise ValueError
-        projection_data = calculate_10k_projections(baseline_data, GROWTH_ASSUMPTIONS)
-        logger.info("Financial projections calculated for all timeframes.")
+        # --- Cache Lookup ---
+        # Inputs are config constants, so an unchanged run (same inputs and code) can reuse the previous projections and PDFs
+        cache = FileCache(CACHE_DIR, ttl_seconds=CACHE_TTL_SECONDS)
+        cache_key = hashlib.md5(
+            json.dumps([dataclasses.asdict(baseline_data), GROWTH_ASSUMPTIONS, output_dir, _source_digest()],
+                       sort_keys=True, default=dict).encode() # default: read-only mappings
+        ).hexdigest()
+        cached = cache.get(cache_key)
+        if cached and not all(os.path.exists(path) for path in cached['paths'].values()):
+            logger.info("Cached report files are missing; regenerating.")
+            cached = None
+
+        generated_paths: Optional[Dict[str, str]]
+        if cached:
+            logger.info("Inputs unchanged since last run; reusing cached projections and reports.")
+            projection_data = cached['projection']
+            generated_paths = cached['paths']
+        else:
+            # --- Calculations ---
+            logger.info("Calculating financial projections...")
+            # calculate_10k_projections should handle missing keys gracefully or raise ValueError
+            projection_data = calculate_10k_projections(baseline_data, GROWTH_TIMEFRAMES)
+            logger.info("Financial projections calculated for all timeframes.")
+
+            # --- Report Generation ---
+            logger.info("Initializing report generator...")
+            report_gen = ReportGenerator(output_dir)
 
-        # --- Report Generation ---
-        logger.info("Initializing report generator...")
-        report_gen = ReportGenerator(str(output_dir))
+            logger.info("Generating 1, 5, and 10-year 10-K reports...")
+            generated_paths = _render_reports(report_gen, projection_data)
 
-        logger.info("Generating 1, 5, and 10-year 10-K reports...")
-        # generate_10k_reports handles parallel generation and aggregates results/errors
-        generated_paths: Optional[Dict[str, str]] = report_gen.generate_10k_reports(projection_data)
+            # Only cache complete runs so failed reports are retried next time
+            if generated_paths and all("FAILED:" not in path for path in generated_paths.values()):
+                cache.set(cache_key, {'projection': projection_data, 'paths': generated_paths})
 
         # --- Summarize Results ---
         if generated_paths:
@@ -86,9 +282,9 @@ def run_report_generation(args: argparse.Namespace) -> None:
             all_successful = True
             for timeframe, path_or_error in generated_paths.items():
                 if "FAILED:" not in path_or_error:
-                    logger.info(f"  [SUCCESS] {timeframe.replace('_',' ').title()} Report: {Path(path_or_error).name}")
+                    logger.info(f"  [SUCCESS] {TIMEFRAME_LABELS[timeframe]} Report: {os.path.basename(path_or_error)}")
                 else:
-                    logger.error(f"  [FAILED]  {timeframe.replace('_',' ').title()} Report Generation: {path_or_error}")
+                    logger.error(f"  [FAILED]  {TIMEFRAME_LABELS[timeframe]} Report Generation: {path_or_error}")
                     all_successful = False
             if not all_successful:
                  logger.warning("One or more reports failed to generate. See logs above for details.")
@@ -101,23 +297,24 @@ def run_report_generation(args: argparse.Namespace) -> None:
     # Specific error handling
     except (ReportGenerationError, ReportRenderingError) as rge:
          logger.error(f"A critical report generation error occurred: {rge}")
-         logger.debug(traceback.format_exc()) # Log full traceback for debugging
+         logger.debug("Traceback:", exc_info=True) # Formatted only if DEBUG is enabled
          print(f"\nERROR: Report Generation Failed. Check log file '{log_file}' for details.", file=sys.stderr)
          sys.exit(1)
     except ValueError as ve: # Catch data validation/calculation errors
          logger.error(f"A data error occurred: {ve}")
-         logger.debug(traceback.format_exc())
+         logger.debug("Traceback:", exc_info=True)
          print(f"\nERROR: Data Error. Check input data and log file '{log_file}'.", file=sys.stderr)
          sys.exit(1)
     except Exception as e: # Catch any other unexpected errors
         logger.error(f"An unexpected error occurred during the process: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
         print(f"\nUNEXPECTED ERROR. Check log file '{log_file}'.", file=sys.stderr)
         sys.exit(1)
 
 def main() -> None:
     """Main entry point."""
     args = parse_arguments()
+    _setup_logging()
     run_report_generation(args)
 
 if __name__ == '__main__':
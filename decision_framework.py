@@ -1,6 +1,9 @@
+import math
+import heapq
 import numpy as np
-import matplotlib.pyplot as plt
-from dataclasses import dataclass
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from dataclasses import dataclass, field
 from typing import List, Dict, Tuple, Optional, Set, Union
 import pandas as pd
 
@@ -8,9 +11,75 @@ import pandas as pd
 #pip install matplotlib
 #pip install dataclasses
 #pip install pandas
+#pip install quantecon  # optional, for mixed-strategy equilibria (or: pip install nashpy)
 
+try:
+    from quantecon.game_theory import NormalFormGame, support_enumeration
+except ImportError:  # QuantEcon is optional; mixed equilibria then fall back to Nashpy
+    NormalFormGame = support_enumeration = None
+try:
+    import nashpy
+except ImportError:
+    nashpy = None
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the kernels below then run as plain Python
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed."""
+        def decorator(func):
+            return func
+        return decorator
 
 
+def _feasible_subsets(costs: np.ndarray, capital_constraint: float):
+    """
+    Yield every non-empty subset (a tuple of indices into `costs`) whose total cost fits
+    
+    Depth-first search over projects in ascending cost order: once a project no longer fits
+    the remaining capital, no costlier one does either, so the rest of that branch is cut.
+    Assumes non-negative costs, as cost estimates are.
+    """
+    order = np.argsort(costs, kind='stable').tolist()
+    sorted_costs = [float(costs[i]) for i in order]
+    chosen = []
+    
+    def extend(start, remaining):
+        for k in range(start, len(order)):
+            if sorted_costs[k] > remaining:
+                break
+            chosen.append(order[k])
+            yield tuple(chosen)
+            yield from extend(k + 1, remaining - sorted_costs[k])
+            chosen.pop()
+    
+    yield from extend(0, capital_constraint)
+
+@njit(cache=True)
+def _roi_kernel(value_count, effort, timeline, cost):
+    """ROI score per project from the struct-of-arrays columns"""
+    out = np.empty(cost.shape[0])
+    for i in range(cost.shape[0]):
+        out[i] = value_count[i] * 10 - effort[i] * 5 - timeline[i] * 0.5 - cost[i] / 100000
+    return out
+
+@njit(cache=True)
+def _simulate_strategy(order, costs, timelines, roi, initial_capital, time_horizon):
+    """Greedily take projects in `order` while capital and months allow; returns (selected, capital left, months, roi)"""
+    selected = np.empty_like(order)
+    n_selected = 0
+    capital_remaining = initial_capital
+    months_used = 0.0
+    total_roi = 0.0
+    for i in order:
+        # Check if we can afford this project (money and time)
+        if costs[i] <= capital_remaining and months_used + timelines[i] <= time_horizon:
+            selected[n_selected] = i
+            n_selected += 1
+            capital_remaining -= costs[i]
+            months_used += timelines[i]
+            total_roi += roi[i]
+    return selected[:n_selected], capital_remaining, months_used, total_roi
+
 @dataclass
 class Project:
     name: str
@@ -25,10 +94,13 @@ class Project:
     dependencies: List[str] = None
     strategic_priority: int = 0  # 1-10 scale
     risk_level: int = 0  # 1-10 scale
+    # Number of potential_value points; the only part of that list the ROI model uses
+    value_count: int = field(init=False)
     
     def __post_init__(self):
         if self.dependencies is None:
             self.dependencies = []
+        self.value_count = len(self.potential_value)
 
 class DecisionFramework:
     def __init__(self):
@@ -39,129 +111,303 @@ class DecisionFramework:
             'max_effort': 'High',
             'effort_levels': {'Low': 1, 'Medium': 2, 'High': 3}
         }
+        self._roi_cache: Dict[str, float] = {}  # ROI score per project name
+        
+        # Struct-of-arrays copy of the numeric project fields, row i <-> self._names[i]
+        self._names: List[str] = []
+        self._row_of: Dict[str, int] = {}  # Project name -> row
+        self._cost = np.empty(0, dtype=np.float64)
+        self._timeline = np.empty(0, dtype=np.float64)
+        self._effort = np.empty(0, dtype=np.int64)  # Encoded via effort_levels
+        self._value_count = np.empty(0, dtype=np.int64)
+        self._strategic_priority = np.empty(0, dtype=np.int64)
+        self._risk_level = np.empty(0, dtype=np.int64)
+        self._dependency_count = np.empty(0, dtype=np.int64)
     
     def add_project(self, project: Project):
         """Add a project to the framework"""
+        row = (project.cost_estimate, project.timeline_months,
+               self.viability_thresholds['effort_levels'].get(project.level_of_effort, 0),
+               project.value_count, project.strategic_priority, project.risk_level,
+               len(project.dependencies))
+        columns = ('_cost', '_timeline', '_effort', '_value_count', '_strategic_priority', '_risk_level',
+                   '_dependency_count')
+        
+        if project.name in self._row_of:
+            # Replacing a project keeps its row position
+            i = self._row_of[project.name]
+            for column, value in zip(columns, row):
+                getattr(self, column)[i] = value
+        else:
+            self._row_of[project.name] = len(self._names)
+            self._names.append(project.name)
+            for column, value in zip(columns, row):
+                setattr(self, column, np.append(getattr(self, column), value))
+        
         self.projects[project.name] = project
+        self._roi_cache.pop(project.name, None)  # Re-score if a project is replaced
+    
+    def _rows(self, names) -> np.ndarray:
+        """Row positions of the named projects in the struct-of-arrays columns"""
+        return np.array([self._row_of[name] for name in names], dtype=np.intp)
+    
+    def _columns(self, projects: Dict[str, Project]) -> Dict[str, np.ndarray]:
+        """
+        Numeric columns of the given projects, in dict order
+
+        Slices the struct-of-arrays copy when every project is the one registered under its name;
+        otherwise (projects not added via add_project) the columns are built from the passed objects.
+        """
+        if all(self.projects.get(name) is project for name, project in projects.items()):
+            rows = self._rows(projects.keys())
+            return {
+                'cost': self._cost[rows],
+                'timeline': self._timeline[rows],
+                'effort': self._effort[rows],
+                'roi': self.roi_scores()[rows],
+                'dependency_count': self._dependency_count[rows],
+                'strategic_priority': self._strategic_priority[rows],
+                'risk_level': self._risk_level[rows],
+            }
+        values = list(projects.values())
+        effort_levels = self.viability_thresholds['effort_levels']
+        return {
+            'cost': np.array([p.cost_estimate for p in values], dtype=np.float64),
+            'timeline': np.array([p.timeline_months for p in values], dtype=np.float64),
+            'effort': np.array([effort_levels.get(p.level_of_effort, 0) for p in values], dtype=np.int64),
+            'roi': np.array([self.calculate_roi_score(p) for p in values], dtype=np.float64),
+            'dependency_count': np.array([len(p.dependencies) for p in values], dtype=np.int64),
+            'strategic_priority': np.array([p.strategic_priority for p in values], dtype=np.int64),
+            'risk_level': np.array([p.risk_level for p in values], dtype=np.int64),
+        }
     
-    def filter_nonviable_projects(self) -> Dict[str, Project]:
-        """Filter out non-viable projects based on constraints"""
-        viable_projects = {}
-        nonviable_projects = {}
-        
-        for name, project in self.projects.items():
-            # Check if project exceeds any threshold
-            if (project.timeline_months > self.viability_thresholds['max_timeline'] or
-                project.cost_estimate > self.viability_thresholds['max_cost'] or
-                self.viability_thresholds['effort_levels'].get(project.level_of_effort, 0) > 
-                self.viability_thresholds['effort_levels'].get(self.viability_thresholds['max_effort'], 0)):
-                nonviable_projects[name] = project
-            else:
-                viable_projects[name] = project
+    def _threshold_limits(self) -> Tuple[float, float, int]:
+        """(max_timeline, max_cost, max effort rank) looked up once per call site"""
+        thresholds = self.viability_thresholds
+        max_effort_rank = thresholds['effort_levels'].get(thresholds['max_effort'], 0)
+        return thresholds['max_timeline'], thresholds['max_cost'], max_effort_rank
+    
+    def filter_nonviable_projects(self) -> Tuple[Dict[str, Project], Dict[str, Project]]:
+        """Split projects into (viable, non-viable) based on constraints"""
+        max_timeline, max_cost, max_effort_rank = self._threshold_limits()
+        # Check every project against all thresholds in one vectorized pass
+        viable_mask = ((self._timeline <= max_timeline) &
+                       (self._cost <= max_cost) &
+                       (self._effort <= max_effort_rank))
+        
+        viable_projects = {self._names[i]: self.projects[self._names[i]] for i in np.flatnonzero(viable_mask)}
+        nonviable_projects = {self._names[i]: self.projects[self._names[i]] for i in np.flatnonzero(~viable_mask)}
         
         print(f"Filtered {len(nonviable_projects)} non-viable projects out of {len(self.projects)} total projects")
-        return viable_projects
+        return viable_projects, nonviable_projects
     
     def analyze_nonviability(self, nonviable_projects: Dict[str, Project]) -> Dict[str, List[str]]:
         """Analyze why projects are non-viable"""
-        nonviability_reasons = {}
+        max_timeline, max_cost, max_effort_rank = self._threshold_limits()
+        max_effort = self.viability_thresholds['max_effort']
+        names = list(nonviable_projects.keys())
+        columns = self._columns(nonviable_projects)  # Masks and messages both come from the passed projects
         
-        for name, project in nonviable_projects.items():
-            reasons = []
-            
-            if project.timeline_months > self.viability_thresholds['max_timeline']:
-                reasons.append(f"Timeline ({project.timeline_months} months) exceeds maximum ({self.viability_thresholds['max_timeline']} months)")
-            
-            if project.cost_estimate > self.viability_thresholds['max_cost']:
-                reasons.append(f"Cost (${project.cost_estimate:,.2f}) exceeds maximum (${self.viability_thresholds['max_cost']:,.2f})")
-            
-            if (self.viability_thresholds['effort_levels'].get(project.level_of_effort, 0) > 
-                self.viability_thresholds['effort_levels'].get(self.viability_thresholds['max_effort'], 0)):
-                reasons.append(f"Effort level ({project.level_of_effort}) exceeds maximum ({self.viability_thresholds['max_effort']})")
-            
-            nonviability_reasons[name] = reasons
+        # One mask per threshold; reasons are only formatted where a mask is set
+        timeline_mask = columns['timeline'] > max_timeline
+        cost_mask = columns['cost'] > max_cost
+        effort_mask = columns['effort'] > max_effort_rank
+        
+        nonviability_reasons = {name: [] for name in names}
+        for i in np.flatnonzero(timeline_mask):
+            project = nonviable_projects[names[i]]
+            nonviability_reasons[names[i]].append(f"Timeline ({project.timeline_months} months) exceeds maximum ({max_timeline} months)")
+        for i in np.flatnonzero(cost_mask):
+            project = nonviable_projects[names[i]]
+            nonviability_reasons[names[i]].append(f"Cost (${project.cost_estimate:,.2f}) exceeds maximum (${max_cost:,.2f})")
+        for i in np.flatnonzero(effort_mask):
+            project = nonviable_projects[names[i]]
+            nonviability_reasons[names[i]].append(f"Effort level ({project.level_of_effort}) exceeds maximum ({max_effort})")
         
         return nonviability_reasons
     
+    def roi_scores(self) -> np.ndarray:
+        """ROI score of every project in the framework, in self._names order"""
+        # Same formula as calculate_roi_score, evaluated over the whole portfolio at once
+        return _roi_kernel(self._value_count, self._effort, self._timeline, self._cost)
+    
     def calculate_roi_score(self, project: Project) -> float:
         """Calculate a simplified ROI score based on potential value vs cost and effort"""
+        # The cache is keyed by name, so it only answers for the registered object of that name
+        if self.projects.get(project.name) is project:
+            if project.name not in self._roi_cache:
+                # Score the whole portfolio in one vectorized pass
+                self._roi_cache.update(zip(self._names, self.roi_scores().tolist()))
+            return self._roi_cache[project.name]
+        
+        # Projects outside the framework are scored one at a time, without caching
         # This is a simplified model - in real applications, you'd have more sophisticated ROI calculations
-        value_score = len(project.potential_value) * 10  # Each value point is worth 10 points
+        value_score = project.value_count * 10  # Each value point is worth 10 points
         effort_penalty = self.viability_thresholds['effort_levels'].get(project.level_of_effort, 0) * 5
         time_penalty = project.timeline_months * 0.5
         cost_penalty = project.cost_estimate / 100000  # Each $100k costs 1 point
         
-        roi_score = value_score - effort_penalty - time_penalty - cost_penalty
-        return roi_score
+        return value_score - effort_penalty - time_penalty - cost_penalty
     
-    def build_payoff_matrix(self, projects: Dict[str, Project], capital_constraint: float) -> Tuple[np.ndarray, List[str]]:
+    def build_candidate_combinations(self, 
+                                     projects: Dict[str, Project], 
+                                     capital_constraint: float, 
+                                     k_top: int = 64) -> List[Tuple[str, ...]]:
+        """
+        Find the k_top highest-ROI project combinations that fit the capital constraint
+        
+        Runs a 0/1 knapsack over (project, capital bucket) where each bucket is
+        capital_constraint / 1000 dollars; every cell keeps only its k_top best subsets.
+        Costs are rounded up to whole buckets, so every returned combination is affordable.
+        
+        Returns:
+            Combinations (tuples of project names, in input order) sorted by total ROI, best first
+        """
+        project_names = list(projects.keys())
+        if capital_constraint <= 0 or not project_names:
+            return []
+        bucket = capital_constraint / 1000
+        
+        # dp maps capital used (in buckets) -> k_top best (roi, subset bitmask) reaching exactly that spend
+        dp: Dict[int, List[Tuple[float, int]]] = {0: [(0.0, 0)]}
+        for i, name in enumerate(project_names):
+            cost = math.ceil(projects[name].cost_estimate / bucket)
+            if cost > 1000:
+                continue
+            value = self.calculate_roi_score(projects[name])
+            for used, entries in sorted(dp.items(), reverse=True):  # Descending, so each project is taken at most once
+                if used + cost > 1000:
+                    continue
+                extended = [(roi + value, mask | (1 << i)) for roi, mask in entries]
+                dp[used + cost] = heapq.nlargest(k_top, dp.get(used + cost, []) + extended)
+        
+        best = heapq.nlargest(k_top, (entry for entries in dp.values() for entry in entries if entry[1]))
+        return [tuple(name for i, name in enumerate(project_names) if mask >> i & 1) for _, mask in best]
+    
+    def _enumerate_affordable_subsets(self, projects: Dict[str, Project], capital_constraint: float) -> np.ndarray:
+        """
+        Membership matrix of every non-empty project subset within the capital constraint
+        
+        Subsets come from _feasible_subsets' pruned search rather than all 2^P bitmasks.
+        Rows come back in itertools.combinations order (by size, then lexicographic), one
+        column per project in `projects` order.
+        """
+        project_names = list(projects.keys())
+        n_projects = len(project_names)
+        if n_projects == 0:
+            return np.zeros((0, 0), dtype=bool)
+        costs = np.array([projects[p].cost_estimate for p in project_names], dtype=np.float64)
+        
+        subsets = list(_feasible_subsets(costs, capital_constraint))
+        membership = np.zeros((len(subsets), n_projects), dtype=bool)
+        for i, subset in enumerate(subsets):
+            membership[i, subset] = True
+        
+        # Sort by subset size, then so that subsets holding earlier projects come first
+        order = np.lexsort(np.vstack([~membership[:, ::-1].T, membership.sum(axis=1)]))
+        return membership[order]
+    
+    def build_payoff_matrix(self, 
+                            projects: Dict[str, Project], 
+                            capital_constraint: float, 
+                            k_top: Optional[int] = None) -> Tuple[np.ndarray, List[str]]:
         """
         Build a payoff matrix for game theory analysis
         
         The matrix represents the strategic interactions between different project combinations
-        under capital constraints.
+        under capital constraints. With k_top set, only the k_top best combinations from
+        build_candidate_combinations are compared instead of every affordable subset.
         """
-        # Get viable project combinations under capital constraint
-        viable_combinations = []
         project_names = list(projects.keys())
         
-        # Generate all possible project combinations
-        from itertools import combinations
-        for r in range(1, len(project_names) + 1):
-            for combo in combinations(project_names, r):
-                total_cost = sum(projects[p].cost_estimate for p in combo)
-                if total_cost <= capital_constraint:
-                    viable_combinations.append(combo)
-        
-        # Create payoff matrix
-        n = len(viable_combinations)
-        payoff_matrix = np.zeros((n, n))
-        
-        # Calculate payoffs for each combination against others
-        for i, combo1 in enumerate(viable_combinations):
-            for j, combo2 in enumerate(viable_combinations):
-                # Self-comparison - calculate ROI score
-                if i == j:
-                    payoff_matrix[i, j] = sum(self.calculate_roi_score(projects[p]) for p in combo1)
-                # Different combinations - calculate strategic advantage
-                else:
-                    # Projects in combo1 but not in combo2 (unique advantage)
-                    unique_to_1 = set(combo1) - set(combo2)
-                    # Projects in both combinations (shared value)
-                    common = set(combo1) & set(combo2)
-                    # Calculate advantage score
-                    advantage_score = sum(self.calculate_roi_score(projects[p]) * 1.2 for p in unique_to_1)
-                    common_score = sum(self.calculate_roi_score(projects[p]) * 0.8 for p in common)
-                    payoff_matrix[i, j] = advantage_score + common_score
+        if k_top is not None:
+            viable_combinations = self.build_candidate_combinations(projects, capital_constraint, k_top)
+            # Membership matrix: one row per combination, one column per project
+            proj_index = {p: i for i, p in enumerate(project_names)}
+            membership = np.zeros((len(viable_combinations), len(project_names)), dtype=bool)
+            for i, combo in enumerate(viable_combinations):
+                membership[i, [proj_index[p] for p in combo]] = True
+        else:
+            membership = self._enumerate_affordable_subsets(projects, capital_constraint)
+            viable_combinations = [tuple(project_names[j] for j in np.flatnonzero(row)) for row in membership]
+        
+        roi = np.array([self.calculate_roi_score(projects[p]) for p in project_names], dtype=np.float64)
+        
+        # Pack each combination into a bitset, ceil(P/8) bytes per row instead of P floats
+        packed = np.packbits(membership, axis=1, bitorder='little')
+        n_bytes = packed.shape[1]
+        # byte_roi[b, v]: total ROI of the projects whose bits are set in value v of byte b
+        roi_by_byte = np.zeros(n_bytes * 8)
+        roi_by_byte[:roi.size] = roi
+        byte_bits = (np.arange(256)[:, None] >> np.arange(8)) & 1
+        byte_roi = roi_by_byte.reshape(n_bytes, 8) @ byte_bits.T
+        
+        # Calculate payoffs for every pair of combinations at once
+        # C_ij: ROI of the projects combos i and j share, looked up from the ANDed bitsets
+        shared_roi = np.zeros((len(viable_combinations), len(viable_combinations)))
+        for b in range(n_bytes):
+            shared_roi += byte_roi[b][packed[:, None, b] & packed[None, :, b]]
+        combo_roi = shared_roi.diagonal().copy()  # s_i: total ROI of combination i (C_ii)
+        # Unique advantage 1.2 * (s_i - C_ij) plus shared value 0.8 * C_ij
+        payoff_matrix = 1.2 * combo_roi[:, None] - 0.4 * shared_roi
+        # Self-comparison - plain ROI score of the combination
+        np.fill_diagonal(payoff_matrix, combo_roi)
         
         return payoff_matrix, viable_combinations
     
     def find_nash_equilibrium(self, payoff_matrix: np.ndarray) -> List[int]:
-        """Find Nash equilibrium in the payoff matrix"""
-        n = payoff_matrix.shape[0]
-        equilibria = []
+        """
+        Find symmetric pure-strategy Nash equilibria in the payoff matrix
         
-        for i in range(n):
-            # Check if strategy i is a best response for player 1
-            if np.all(payoff_matrix[i, :] >= np.max(payoff_matrix[:, :], axis=0) - 0.001):
-                # Check if strategy i is also a best response for player 2
-                if np.all(payoff_matrix[:, i] <= np.max(payoff_matrix[:, :], axis=1) + 0.001):
-                    equilibria.append(i)
+        payoff_matrix[i, j] is the payoff of playing combination i against combination j, for
+        either player, so the game is (P, P.T). Both players choosing i is an equilibrium when
+        P[i, i] is the best payoff any combination earns against i, i.e. the max of column i.
+        """
+        if payoff_matrix.size == 0:
+            return []
+        # Player 2's deviation j to (i, j) pays P.T[i, j] = P[j, i], the same column max as player 1's
+        best_response = np.diag(payoff_matrix) >= payoff_matrix.max(axis=0) - 0.001
+        return np.flatnonzero(best_response).tolist()
+    
+    def find_mixed_nash_equilibria(self, payoff_matrix: np.ndarray) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Find all Nash equilibria (mixed strategies included) of the symmetric game (P, P.T)
         
-        return equilibria
+        Uses QuantEcon's Numba-compiled support enumeration, or Nashpy's if only Nashpy is
+        installed. Support enumeration grows exponentially with the number of strategies, so
+        pass a small matrix (e.g. build_payoff_matrix with k_top) rather than every combination.
+        
+        Returns:
+            List of (player 1 strategy, player 2 strategy) probability vectors
+        """
+        if support_enumeration is not None:
+            # A square payoff array is read by QuantEcon as a symmetric two-player game
+            return list(support_enumeration(NormalFormGame(payoff_matrix)))
+        if nashpy is not None:
+            return list(nashpy.Game(payoff_matrix, payoff_matrix.T).support_enumeration())
+        raise ImportError("Mixed-strategy equilibria need quantecon or nashpy (pip install quantecon)")
     
     def analyze_interdependencies(self, projects: Dict[str, Project]) -> Dict[str, Set[str]]:
         """Analyze project interdependencies"""
-        dependency_graph = {}
+        # Index projects plus any dependency that is not itself in `projects` (it has no known dependencies)
+        names = list(projects.keys())
+        for project in projects.values():
+            names.extend(d for d in project.dependencies if d not in projects)
+        node_index = {name: i for i, name in enumerate(dict.fromkeys(names))}
+        node_names = list(node_index)
         
+        # reach[i, j] is True when node i depends on node j
+        n = len(node_names)
+        reach = np.zeros((n, n), dtype=bool)
         for name, project in projects.items():
-            dependency_graph[name] = set(project.dependencies)
+            reach[node_index[name], [node_index[d] for d in project.dependencies]] = True
         
-        # Find indirect dependencies through transitive closure
-        for k in dependency_graph:
-            for i in dependency_graph:
-                if k in dependency_graph[i]:
-                    dependency_graph[i].update(dependency_graph[k])
+        # Find indirect dependencies through transitive closure (Warshall, intermediate node k outermost)
+        for k in range(n):
+            reach |= reach[:, k:k + 1] & reach[k:k + 1, :]
+        
+        dependency_graph = {name: {node_names[j] for j in np.flatnonzero(reach[node_index[name]])}
+                            for name in projects}
         
         return dependency_graph
     
@@ -180,40 +426,28 @@ class DecisionFramework:
         Returns:
             Dictionary of different paths and their outcomes
         """
-        # Sort projects by ROI score
-        project_roi = {name: self.calculate_roi_score(project) for name, project in projects.items()}
-        sorted_projects = sorted(project_roi.items(), key=lambda x: x[1], reverse=True)
+        names = list(projects.keys())
+        columns = self._columns(projects)
+        costs = columns['cost']
+        timelines = columns['timeline']
+        roi = columns['roi']
         
-        # Define different strategies
+        # Define different strategies as orderings of positions in `names` (stable, like sorted())
         strategies = {
-            "high_roi_first": [p[0] for p in sorted_projects],
-            "low_cost_first": sorted([p for p in projects.items()], key=lambda x: x[1].cost_estimate),
-            "quick_wins": sorted([p for p in projects.items()], key=lambda x: x[1].timeline_months)
+            "high_roi_first": np.argsort(-roi, kind='stable'),
+            "low_cost_first": np.argsort(costs, kind='stable'),
+            "quick_wins": np.argsort(timelines, kind='stable')
         }
         
         results = {}
         
         # Simulate each strategy
-        for strategy_name, project_order in strategies.items():
-            capital_remaining = initial_capital
-            months_used = 0
-            projects_selected = []
-            total_roi = 0
-            
-            for project_name in project_order:
-                project = projects[project_name]
-                
-                # Check if we can afford this project (money and time)
-                if (project.cost_estimate <= capital_remaining and 
-                    months_used + project.timeline_months <= time_horizon):
-                    # Add project to our selection
-                    projects_selected.append(project_name)
-                    capital_remaining -= project.cost_estimate
-                    months_used += project.timeline_months
-                    total_roi += project_roi[project_name]
+        for strategy_name, order in strategies.items():
+            selected, capital_remaining, months_used, total_roi = _simulate_strategy(
+                order, costs, timelines, roi, float(initial_capital), float(time_horizon))
             
             results[strategy_name] = {
-                "projects": projects_selected,
+                "projects": [names[i] for i in selected],
                 "capital_used": initial_capital - capital_remaining,
                 "capital_remaining": capital_remaining,
                 "months_used": months_used,
@@ -222,35 +456,56 @@ class DecisionFramework:
         
         return results
 
-    def visualize_project_comparison(self, projects: Dict[str, Project]):
-        """Visualize project comparison based on cost, timeline, and ROI"""
+    def to_dataframe(self, projects: Dict[str, Project]) -> pd.DataFrame:
+        """Summary table of the given projects, one row each, built straight from the column arrays"""
+        columns = self._columns(projects)
+        return pd.DataFrame({
+            'Name': list(projects.keys()),
+            'Cost': columns['cost'],
+            'Timeline': columns['timeline'],
+            'Effort': [project.level_of_effort for project in projects.values()],
+            'ROI Score': columns['roi'],
+            'Dependencies': columns['dependency_count'],
+            'Strategic Priority': columns['strategic_priority'],
+            'Risk Level': columns['risk_level']
+        })
+    
+    def visualize_project_comparison(self, projects: Dict[str, Project], output_path: Optional[str] = None) -> Figure:
+        """
+        Visualize project comparison based on cost, timeline, and ROI
+        
+        Builds the chart on a standalone Figure (no pyplot state), saving it to output_path
+        when given, and returns the Figure.
+        """
         names = list(projects.keys())
-        costs = [p.cost_estimate / 1000 for p in projects.values()]  # Convert to thousands
-        timelines = [p.timeline_months for p in projects.values()]
-        roi_scores = [self.calculate_roi_score(p) for p in projects.values()]
+        columns = self._columns(projects)  # Cost, timeline and ROI all from the same source
+        costs = columns['cost'] / 1000  # Convert to thousands
+        timelines = columns['timeline']
+        roi_scores = columns['roi']
         
         # Normalize ROI scores for bubble size (all positive)
-        min_roi = min(roi_scores)
-        normalized_roi = [r - min_roi + 10 for r in roi_scores]  # Add 10 to ensure positive values
+        normalized_roi = roi_scores - roi_scores.min() + 10  # Add 10 to ensure positive values
         
-        plt.figure(figsize=(12, 8))
-        scatter = plt.scatter(costs, timelines, s=normalized_roi*20, alpha=0.6)
+        fig = Figure(figsize=(12, 8))
+        ax = fig.subplots()
+        scatter = ax.scatter(costs, timelines, s=normalized_roi * 20, c=roi_scores, cmap='viridis', alpha=0.6)
         
         # Add project labels
-        for i, name in enumerate(names):
-            plt.annotate(name, (costs[i], timelines[i]), 
-                        fontsize=8, ha='center', va='center')
+        for name, cost, timeline in zip(names, costs, timelines):
+            ax.annotate(name, (cost, timeline), fontsize=8, ha='center', va='center')
         
-        plt.xlabel('Cost (thousands $)')
-        plt.ylabel('Timeline (months)')
-        plt.title('Project Comparison: Cost vs Timeline vs ROI')
-        plt.grid(True, linestyle='--', alpha=0.7)
+        ax.set_xlabel('Cost (thousands $)')
+        ax.set_ylabel('Timeline (months)')
+        ax.set_title('Project Comparison: Cost vs Timeline vs ROI')
+        ax.grid(True, linestyle='--', alpha=0.7)
         
-        # Add colorbar legend
-        plt.colorbar(scatter, label='ROI Score')
+        # Add colorbar legend (bubble colour follows ROI)
+        fig.colorbar(scatter, ax=ax, label='ROI Score')
         
-        plt.tight_layout()
-        plt.show()
+        fig.tight_layout()
+        if output_path is not None:
+            FigureCanvasAgg(fig).print_figure(output_path)
+        return fig
 
 # Example usage with Beauty First Cosmetics data
 def create_bfc_projects():
@@ -476,11 +731,9 @@ def main():
     print(f"Loaded {len(bfc_projects)} projects from Beauty First Cosmetics")
     
     # Filter non-viable projects
-    viable_projects = framework.filter_nonviable_projects()
+    viable_projects, nonviable_projects = framework.filter_nonviable_projects()
     
     # Analyze why projects are non-viable
-    nonviable_projects = {name: project for name, project in framework.projects.items() 
-                         if name not in viable_projects}
     nonviability_reasons = framework.analyze_nonviability(nonviable_projects)
     
     print("\nNon-viable projects and reasons:")
@@ -540,23 +793,12 @@ def main():
         print(f"- Total ROI score: {results['total_roi']:.2f}")
     
     # Visualize project comparison
-    framework.visualize_project_comparison(viable_projects)
+    chart_path = "project_comparison.png"
+    framework.visualize_project_comparison(viable_projects, output_path=chart_path)
+    print(f"\nProject comparison chart saved to {chart_path}")
     
     # Create a DataFrame for easier analysis
-    project_data = []
-    for name, project in viable_projects.items():
-        project_data.append({
-            'Name': name,
-            'Cost': project.cost_estimate,
-            'Timeline': project.timeline_months,
-            'Effort': project.level_of_effort,
-            'ROI Score': framework.calculate_roi_score(project),
-            'Dependencies': len(project.dependencies),
-            'Strategic Priority': project.strategic_priority,
-            'Risk Level': project.risk_level
-        })
-    
-    df = pd.DataFrame(project_data)
+    df = framework.to_dataframe(viable_projects)
     print("\nProject Data Summary:")
     print(df.sort_values('ROI Score', ascending=False))
 
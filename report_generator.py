@@ -2,96 +2,93 @@
 Generates hypothetical SEC 10-K reports for BFC for one-year, five-year, and ten-year intervals.
 """
 
-from bfc_reports.baseline import get_baseline_data, get_company_overview
-from bfc_reports.config import GROWTH_ASSUMPTIONS
-
-def generate_one_year_report():
-    baseline = get_baseline_data()
-    growth = GROWTH_ASSUMPTIONS['one_year']
-    company_overview = get_company_overview()
-
-    # Calculate updated financial metrics
-    revenue = 4000 * (1 + growth['revenue_growth_pct'] / 100)
-    assets = baseline['assets'] * (1 + growth['asset_growth_pct'] / 100)
-    liabilities = baseline['liabilities'] * (1 + growth['liability_growth_pct'] / 100)
-    equity = baseline['equity'] * (1 + growth['equity_growth_pct'] / 100)
-
-    report = f"""
-BEAUTY FIRST COSMETICS, INC.
-FORM 10-K – ONE-YEAR FORWARD REPORT
+from string import Template
+
+from src.core.baseline import get_company_overview
+from src.core.config import PROJECTIONS
+
+# --- Text shared by all three reports, written once ---
+def _section(title):
+    """Section heading between the report's horizontal rules."""
+    return "=" * 68 + "\n" + title + "\n" + "-" * 68 + "\n"
+
+_COMPANY_HEADER = "\nBEAUTY FIRST COSMETICS, INC.\n"
+# The overview text is static, so it is baked into the templates ($ escaped) rather than substituted per report
+_BUSINESS_OVERVIEW = _section("I. BUSINESS OVERVIEW") + get_company_overview().replace("$", "$$") + "\n"
+_RISK_FACTORS = _section("II. RISK FACTORS")
+_SELECTED_FINANCIAL_DATA = _section("III. SELECTED FINANCIAL DATA (Hypothetical Estimates)")
+_MD_AND_A = _section("IV. MANAGEMENT’S DISCUSSION & ANALYSIS (MD&A)")
+_FINANCIAL_STATEMENTS = _section("V. FINANCIAL STATEMENTS (Summarized)") + (
+    "Balance Sheet Snapshot:\n"
+    "    - Total Assets: ~$$${assets}M\n"
+    "    - Total Liabilities: ~$$${liabilities}M\n"
+    "    - Total Equity: ~$$${equity}M\n"
+    "\n"
+    "Income Statement Highlights:\n"
+    "    - Estimated Revenue: ~$$${revenue}M\n"
+)
+_FORWARD_LOOKING = _section("VI. FORWARD-LOOKING STATEMENTS")
+_ASSUMPTIONS = _section("VII. ASSUMPTIONS & SENSITIVITY ANALYSIS") + "Assumptions:\n"
+_RECOMMENDATIONS = _section("VIII. STRATEGIC RECOMMENDATIONS & IMPLEMENTATION TIMELINE") + "Recommendations:\n"
+
+_ONE_YEAR_TEMPLATE = Template(
+    _COMPANY_HEADER
+    + """FORM 10-K – ONE-YEAR FORWARD REPORT
 Fiscal Year Ending: December 31, 2020 (Hypothetical)
 
-====================================================================
-I. BUSINESS OVERVIEW
---------------------------------------------------------------------
-{company_overview}
-Key strategic initiatives for the upcoming year include:
+"""
+    + _BUSINESS_OVERVIEW
+    + """Key strategic initiatives for the upcoming year include:
 - Early-stage global expansion (initial market entry in the UK and Germany).
 - Digital transformation via the commercial launch of the Magic Mirror AR application.
 - Operational improvements driven by ERP upgrades and streamlined R&D-to-POS processes.
-Maintaining approximately a 7% market share in a $52B industry remains a priority.
+Maintaining approximately a 7% market share in a $$52B industry remains a priority.
 
-====================================================================
-II. RISK FACTORS
---------------------------------------------------------------------
-- Global Expansion: Exposure to regulatory and market risks in the UK and Germany.
+"""
+    + _RISK_FACTORS
+    + """- Global Expansion: Exposure to regulatory and market risks in the UK and Germany.
 - Digital Adoption: The Magic Mirror AR app is in early stages; consumer acceptance is being monitored.
 - Operational Disruptions: Ongoing supply chain and cyber risks.
 - Customer Concentration: Dependence on major accounts (e.g., Walmart at ~16-18% of net sales).
 - Competitive Pressures: Intense competition from industry leaders.
 - Regulatory & Compliance: Enhanced scrutiny from FDA and international regulators.
 
-====================================================================
-III. SELECTED FINANCIAL DATA (Hypothetical Estimates)
---------------------------------------------------------------------
-- Revenue: ~${revenue:.0f}M (a 5% increase from baseline).
-- Total Assets: ~${assets:.0f}M (3% growth).
-- Total Liabilities: ~${liabilities:.0f}M (2% growth).
-- Total Equity: ~${equity:.0f}M (6% growth).
-- Unrestricted Cash: Remains robust at ~$2.1B.
-
-====================================================================
-IV. MANAGEMENT’S DISCUSSION & ANALYSIS (MD&A)
---------------------------------------------------------------------
-This fiscal year marks an important transition with:
+"""
+    + _SELECTED_FINANCIAL_DATA
+    + """- Revenue: ~$$${revenue}M (a 5% increase from baseline).
+- Total Assets: ~$$${assets}M (3% growth).
+- Total Liabilities: ~$$${liabilities}M (2% growth).
+- Total Equity: ~$$${equity}M (6% growth).
+- Unrestricted Cash: Remains robust at ~$$2.1B.
+
+"""
+    + _MD_AND_A
+    + """This fiscal year marks an important transition with:
 - Initial penetration into UK and German markets.
 - Launch and early adoption of the Magic Mirror AR application.
 - Initial cost efficiencies from ERP and agile manufacturing.
 Short-term revenue and operational volatility is expected as the company adapts to these changes.
 
-====================================================================
-V. FINANCIAL STATEMENTS (Summarized)
---------------------------------------------------------------------
-Balance Sheet Snapshot:
-    - Total Assets: ~${assets:.0f}M
-    - Total Liabilities: ~${liabilities:.0f}M
-    - Total Equity: ~${equity:.0f}M
-
-Income Statement Highlights:
-    - Estimated Revenue: ~${revenue:.0f}M
-    - Improved operating margins due to cost efficiencies.
+"""
+    + _FINANCIAL_STATEMENTS
+    + """    - Improved operating margins due to cost efficiencies.
     
 Cash Flow Highlights:
     - Strong operating cash flow.
     - Increased CAPEX for ERP and digital initiatives.
 
-====================================================================
-VI. FORWARD-LOOKING STATEMENTS
---------------------------------------------------------------------
-Forward‑looking statements in this report are based on assumptions regarding market growth, digital adoption, operational improvements, and macroeconomic conditions. Actual results may vary materially from these projections.
+"""
+    + _FORWARD_LOOKING
+    + """Forward‑looking statements in this report are based on assumptions regarding market growth, digital adoption, operational improvements, and macroeconomic conditions. Actual results may vary materially from these projections.
 
-====================================================================
-VII. ASSUMPTIONS & SENSITIVITY ANALYSIS
---------------------------------------------------------------------
-Assumptions:
-- A 5% revenue increase driven by early international and digital expansion.
+"""
+    + _ASSUMPTIONS
+    + """- A 5% revenue increase driven by early international and digital expansion.
 - Sensitivity: A 1% variation in consumer confidence or regulatory delays could materially impact net sales.
 
-====================================================================
-VIII. STRATEGIC RECOMMENDATIONS & IMPLEMENTATION TIMELINE
---------------------------------------------------------------------
-Recommendations:
-1. Accelerate international market entry and secure local partnerships.
+"""
+    + _RECOMMENDATIONS
+    + """1. Accelerate international market entry and secure local partnerships.
 2. Enhance marketing efforts to boost Magic Mirror AR adoption.
 3. Diversify customer base to reduce dependency on key accounts.
 4. Strengthen operational risk management through improved cybersecurity and supply chain diversification.
@@ -104,92 +101,64 @@ Timeline:
 CONCLUSION:
 Short-term performance is modest but sets the stage for long-term strategic growth.
     """
-    return report
+)
 
-def generate_five_year_report():
-    baseline = get_baseline_data()
-    growth = GROWTH_ASSUMPTIONS['five_year']
-    company_overview = get_company_overview()
-
-    revenue = 4000 * (1 + growth['cumulative_revenue_growth_pct'] / 100)
-    assets = baseline['assets'] * (1 + growth['asset_growth_pct'] / 100)
-    liabilities = baseline['liabilities'] * (1 + growth['liability_growth_pct'] / 100)
-    equity = baseline['equity'] * (1 + growth['equity_growth_pct'] / 100)
-
-    report = f"""
-BEAUTY FIRST COSMETICS, INC.
-FORM 10-K – FIVE-YEAR FORWARD REPORT
+_FIVE_YEAR_TEMPLATE = Template(
+    _COMPANY_HEADER
+    + """FORM 10-K – FIVE-YEAR FORWARD REPORT
 Fiscal Year Ending: December 31, 2025 (Hypothetical)
 
-====================================================================
-I. BUSINESS OVERVIEW
---------------------------------------------------------------------
-{company_overview}
-Key developments over the past five years include:
+"""
+    + _BUSINESS_OVERVIEW
+    + """Key developments over the past five years include:
 - Established international presence with meaningful revenue streams in the UK and Germany.
 - Maturation of the Magic Mirror AR application driving enhanced customer engagement.
 - Significant operational improvements via ERP upgrades and agile manufacturing.
 - Diversification across product segments bolstering revenue stability.
 
-====================================================================
-II. RISK FACTORS
---------------------------------------------------------------------
-- Intense competitive pressures from global players and emerging entrants.
+"""
+    + _RISK_FACTORS
+    + """- Intense competitive pressures from global players and emerging entrants.
 - Regulatory complexities across multiple jurisdictions.
 - Macroeconomic volatility and potential supply chain disruptions.
 - Technological obsolescence risk requiring continuous innovation.
 
-====================================================================
-III. SELECTED FINANCIAL DATA (Hypothetical Estimates)
---------------------------------------------------------------------
-- Revenue: ~${revenue:.0f}M (20% cumulative growth).
-- Total Assets: ~${assets:.0f}M (15% growth).
-- Total Liabilities: ~${liabilities:.0f}M (10% growth).
-- Total Equity: ~${equity:.0f}M (25% growth).
+"""
+    + _SELECTED_FINANCIAL_DATA
+    + """- Revenue: ~$$${revenue}M (20% cumulative growth).
+- Total Assets: ~$$${assets}M (15% growth).
+- Total Liabilities: ~$$${liabilities}M (10% growth).
+- Total Equity: ~$$${equity}M (25% growth).
 - Significant CAPEX allocated to ERP, AR/VR technology, and global compliance systems.
 
-====================================================================
-IV. MANAGEMENT’S DISCUSSION & ANALYSIS (MD&A)
---------------------------------------------------------------------
-Over five years, BFC has transformed its business model:
+"""
+    + _MD_AND_A
+    + """Over five years, BFC has transformed its business model:
 - International growth now contributes a substantial portion of revenue.
 - The Magic Mirror AR app has matured into a key customer engagement tool.
 - Operational cost efficiencies and process improvements have significantly enhanced margins.
 - Continued investment in R&D has driven new product innovation.
 
-====================================================================
-V. FINANCIAL STATEMENTS (Summarized)
---------------------------------------------------------------------
-Balance Sheet Snapshot:
-    - Total Assets: ~${assets:.0f}M
-    - Total Liabilities: ~${liabilities:.0f}M
-    - Total Equity: ~${equity:.0f}M
-
-Income Statement Highlights:
-    - Estimated Revenue: ~${revenue:.0f}M
-    - Improved operating margins due to enhanced efficiencies.
+"""
+    + _FINANCIAL_STATEMENTS
+    + """    - Improved operating margins due to enhanced efficiencies.
 
 Cash Flow Highlights:
     - Strong operating cash flow supporting technology investments.
     - Balanced financing with controlled debt levels.
 
-====================================================================
-VI. FORWARD-LOOKING STATEMENTS
---------------------------------------------------------------------
-This report’s forward‑looking statements assume steady international growth, continued consumer adoption of digital platforms, and stable economic conditions. Uncertainties in these areas could lead to material deviations from projections.
+"""
+    + _FORWARD_LOOKING
+    + """This report’s forward‑looking statements assume steady international growth, continued consumer adoption of digital platforms, and stable economic conditions. Uncertainties in these areas could lead to material deviations from projections.
 
-====================================================================
-VII. ASSUMPTIONS & SENSITIVITY ANALYSIS
---------------------------------------------------------------------
-Assumptions:
-- A cumulative 20% revenue increase driven by international expansion and digital innovation.
+"""
+    + _ASSUMPTIONS
+    + """- A cumulative 20% revenue increase driven by international expansion and digital innovation.
 - Sensitivity: A 2-3% swing in international market growth or increased regulatory costs could significantly affect margins.
 
-====================================================================
-VIII. STRATEGIC RECOMMENDATIONS & IMPLEMENTATION TIMELINE
---------------------------------------------------------------------
-Recommendations:
-1. Consolidate and expand international operations with deeper local market engagement.
+"""
+    + _RECOMMENDATIONS
+    + """1. Consolidate and expand international operations with deeper local market engagement.
 2. Enhance and expand the digital ecosystem through continuous innovation in the Magic Mirror AR platform.
 3. Drive further operational efficiencies via advanced ERP and agile manufacturing.
 4. Increase R&D investments to sustain competitive product innovation.
@@ -202,97 +171,69 @@ Timeline:
 CONCLUSION:
 BFC has evolved into a robust mid-tier competitor with a solid global presence and mature digital channels.
     """
-    return report
+)
 
-def generate_ten_year_report():
-    baseline = get_baseline_data()
-    growth = GROWTH_ASSUMPTIONS['ten_year']
-    company_overview = get_company_overview()
-
-    revenue = 4000 * (1 + growth['cumulative_revenue_growth_pct'] / 100)
-    assets = baseline['assets'] * (1 + growth['asset_growth_pct'] / 100)
-    liabilities = baseline['liabilities'] * (1 + growth['liability_growth_pct'] / 100)
-    equity = baseline['equity'] * (1 + growth['equity_growth_pct'] / 100)
-
-    report = f"""
-BEAUTY FIRST COSMETICS, INC.
-FORM 10-K – TEN-YEAR FORWARD REPORT
+_TEN_YEAR_TEMPLATE = Template(
+    _COMPANY_HEADER
+    + """FORM 10-K – TEN-YEAR FORWARD REPORT
 Fiscal Year Ending: December 31, 2030 (Hypothetical)
 
-====================================================================
-I. BUSINESS OVERVIEW
---------------------------------------------------------------------
-{company_overview}
-Over the past decade, BFC has evolved into an industry leader marked by:
+"""
+    + _BUSINESS_OVERVIEW
+    + """Over the past decade, BFC has evolved into an industry leader marked by:
 - A comprehensive international footprint across established and emerging markets.
 - Technological leadership with fully integrated AR/VR consumer experiences and personalized offerings.
 - A diversified, mature product portfolio spanning Cosmetics, Hair, Fragrances, Skin Care, and Beauty Tools.
 - Exceptional operational efficiency driven by state-of-the-art ERP systems and agile manufacturing processes.
 
-====================================================================
-II. RISK FACTORS
---------------------------------------------------------------------
-- Global Competition: Ongoing pressure from global giants and nimble new entrants.
+"""
+    + _RISK_FACTORS
+    + """- Global Competition: Ongoing pressure from global giants and nimble new entrants.
 - Regulatory Overhead: Increased scrutiny and complex compliance in multiple jurisdictions.
 - Macroeconomic Sensitivities: Exposure to global economic cycles, inflation, and currency fluctuations.
 - Technological Disruption: Continuous need for significant capital investment in innovation.
 - Legacy Issues: Persistent challenges in supply chain dependencies and customer concentration.
 
-====================================================================
-III. SELECTED FINANCIAL DATA (Hypothetical Estimates)
---------------------------------------------------------------------
-- Revenue: ~${revenue:.0f}M (40% cumulative growth).
-- Total Assets: ~${assets:.0f}M (30% growth).
-- Total Liabilities: ~${liabilities:.0f}M (20% growth).
-- Total Equity: ~${equity:.0f}M (50% growth).
+"""
+    + _SELECTED_FINANCIAL_DATA
+    + """- Revenue: ~$$${revenue}M (40% cumulative growth).
+- Total Assets: ~$$${assets}M (30% growth).
+- Total Liabilities: ~$$${liabilities}M (20% growth).
+- Total Equity: ~$$${equity}M (50% growth).
 - Robust cash flows support ongoing reinvestment in R&D, technology, and shareholder returns.
 
-====================================================================
-IV. MANAGEMENT’S DISCUSSION & ANALYSIS (MD&A)
---------------------------------------------------------------------
-The ten-year outlook reflects a complete strategic transformation:
+"""
+    + _MD_AND_A
+    + """The ten-year outlook reflects a complete strategic transformation:
 - International Dominance: BFC commands significant market share globally.
 - Digital and Personalization Leadership: The Magic Mirror AR platform has evolved into a full digital ecosystem.
 - Operational Excellence: Industry-leading cost structures and product-to-market cycles.
 - Strategic Diversification: Enhanced R&D and product innovation have delivered sustainable growth.
 Ongoing investments in technology and operational efficiency remain critical.
 
-====================================================================
-V. FINANCIAL STATEMENTS (Summarized)
---------------------------------------------------------------------
-Balance Sheet Snapshot:
-    - Total Assets: ~${assets:.0f}M
-    - Total Liabilities: ~${liabilities:.0f}M
-    - Total Equity: ~${equity:.0f}M
-
-Income Statement Highlights:
-    - Estimated Revenue: ~${revenue:.0f}M
-    - Strong operating income driven by premium pricing and efficiency gains.
+"""
+    + _FINANCIAL_STATEMENTS
+    + """    - Strong operating income driven by premium pricing and efficiency gains.
 
 Cash Flow Highlights:
     - Exceptionally strong operating cash flow enabling aggressive reinvestment.
     - Consistent CAPEX for technological advancements and global infrastructure.
     - Balanced financing supporting shareholder rewards through dividends and buybacks.
 
-====================================================================
-VI. FORWARD-LOOKING STATEMENTS
---------------------------------------------------------------------
-Forward‑looking statements assume continued global economic stability, sustained technological advancement, and effective regulatory management. Deviations from these assumptions could materially impact actual outcomes.
+"""
+    + _FORWARD_LOOKING
+    + """Forward‑looking statements assume continued global economic stability, sustained technological advancement, and effective regulatory management. Deviations from these assumptions could materially impact actual outcomes.
 
-====================================================================
-VII. ASSUMPTIONS & SENSITIVITY ANALYSIS
---------------------------------------------------------------------
-Assumptions:
-- A cumulative 40% revenue growth achieved through aggressive global expansion and premium product positioning.
+"""
+    + _ASSUMPTIONS
+    + """- A cumulative 40% revenue growth achieved through aggressive global expansion and premium product positioning.
 - EBITDA margins improve by 10-15% due to operational efficiencies.
 - Sensitivity: Small shifts in consumer trends or regulatory conditions (±2-3%) could significantly affect long-term performance.
 - Continuous reinvestment in technology and R&D is assumed.
 
-====================================================================
-VIII. STRATEGIC RECOMMENDATIONS & IMPLEMENTATION TIMELINE
---------------------------------------------------------------------
-Recommendations:
-1. Pursue aggressive global market leadership and expand into new emerging regions.
+"""
+    + _RECOMMENDATIONS
+    + """1. Pursue aggressive global market leadership and expand into new emerging regions.
 2. Reinforce digital innovation by advancing AR/VR capabilities and leveraging big data for hyper-personalization.
 3. Institutionalize operational excellence with ongoing ERP and manufacturing process improvements.
 4. Sustain high levels of R&D investment to drive next-generation product development.
@@ -306,4 +247,24 @@ Timeline:
 CONCLUSION:
 After a decade of disciplined execution and strategic transformation, BFC stands as an industry leader with robust financial performance and sustainable competitive advantage.
     """
-    return report
+)
+
+# Report body per timeframe, parsed once at import; only the figures are substituted, pre-formatted
+_TEMPLATES = {
+    'one_year': _ONE_YEAR_TEMPLATE,
+    'five_year': _FIVE_YEAR_TEMPLATE,
+    'ten_year': _TEN_YEAR_TEMPLATE,
+}
+
+def _generate(timeframe):
+    figures = PROJECTIONS[timeframe]
+    return _TEMPLATES[timeframe].substitute({field: f"{value:.0f}" for field, value in figures.items()})
+
+def generate_one_year_report():
+    return _generate('one_year')
+
+def generate_five_year_report():
+    return _generate('five_year')
+
+def generate_ten_year_report():
+    return _generate('ten_year')
@@ -0,0 +1,27 @@
+"""
+Ahead-of-time build of the projection kernels in quantitative_model.py.
+
+Run once per platform from the repository root:
+
+    python -m src.analysis.build_native
+
+This writes the `quantitative_model_native` extension next to this file;
+quantitative_model imports it when present and otherwise falls back to the
+JIT-compiled kernels. Requires Numba with `numba.pycc` and a C compiler.
+"""
+
+import os
+
+from numba.pycc import CC
+
+from src.analysis.quantitative_model import _cagr_batch_kernel, _project_balance_kernel, _project_core
+
+cc = CC('quantitative_model_native')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+# Export the plain Python bodies of the JIT kernels so both builds share one definition
+cc.export('cagr_batch', 'f8[:](f8[:], f8[:], i8[:])')(_cagr_batch_kernel.py_func)
+cc.export('project_batch', 'f8[:,:](f8[:], f8[:,:])')(_project_balance_kernel.py_func)
+cc.export('project_core', 'f8[:,:](f8[:], f8, f8, f8, f8[:], f8[:])')(_project_core.py_func)
+
+if __name__ == '__main__':
+    cc.compile()
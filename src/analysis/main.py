@@ -3,28 +3,40 @@ Main entry point for generating 1, 5, and 10-year 10-K style projection reports.
 (Version 3 - Refined)
 """
 
+import os
 import sys
+import atexit
 import logging
+import logging.handlers
 import argparse
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 import traceback
+import dataclasses
+import hashlib
+import json
+import shutil
 
 # --- Module Imports ---
 # Use absolute imports assuming 'src' is runnable or PYTHONPATH is set
-from src.core.config import get_config, BASELINE_DATA, GROWTH_ASSUMPTIONS
+from src.core.config import BASELINE_DATA, GROWTH_ASSUMPTIONS, GROWTH_TIMEFRAMES, CACHE_DIR
 from src.core.baseline import get_baseline_data
-from src.analysis.quantitative_model import calculate_10k_projections
-from src.reports.report_generator import ReportGenerator, ReportGenerationError, ReportRenderingError
+# Calculation and report modules (Numba/ReportLab) are imported in run_report_generation
 
 # --- Logging Setup ---
 log_file = '10k_generator_v3.log'
+log_format = '%(asctime)s - %(name)s - [%(levelname)s] - %(message)s' # Slightly more detailed format
+file_handler = logging.FileHandler(log_file, mode='w', delay=True) # Overwrite log each run; opened on first write
+file_handler.setFormatter(logging.Formatter(log_format))
+# Batch file writes; ERROR and above are written through immediately
+memory_handler = logging.handlers.MemoryHandler(capacity=200, flushLevel=logging.ERROR, target=file_handler)
+atexit.register(memory_handler.flush)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - [%(levelname)s] - %(message)s', # Slightly more detailed format
+    format=log_format,
     handlers=[
-        logging.FileHandler(log_file, mode='w'), # Overwrite log each run
-        logging.StreamHandler(sys.stdout)
+        memory_handler,
+        logging.StreamHandler(sys.stdout) # Console output stays unbuffered
     ]
 )
 logger = logging.getLogger(__name__) # Get logger for this module
@@ -44,21 +56,74 @@ def parse_arguments() -> argparse.Namespace:
     )
     return parser.parse_args()
 
+# --- Rendered Report Cache ---
+_REPORT_MANIFEST = 'reports.json' # {timeframe: pdf file name}; written last, so its presence marks a complete entry
+# Modules that produce the figures in the PDFs; the report generator's own module is added per call
+_PROJECTION_MODULES = ('src.core.config', 'src.analysis.quantitative_model')
+
+def _report_cache_dir(generator_cls: type) -> Path:
+    """
+    Content-addressed cache directory for the current inputs.
+    The key covers the assumptions and the source of the config, calculation and report modules,
+    so editing any of them renders afresh.
+    """
+    module_names = _PROJECTION_MODULES + (generator_cls.__module__,)
+    sources = b''.join(Path(sys.modules[name].__file__).read_bytes() for name in module_names)
+    key = hashlib.blake2b(repr((BASELINE_DATA, GROWTH_ASSUMPTIONS)).encode() + sources).hexdigest()[:16]
+    return Path(CACHE_DIR) / 'reports' / key
+
+def _restore_cached_reports(cache_dir: Path, output_dir: str) -> Optional[Dict[str, str]]:
+    """Copies cached PDFs into output_dir; returns {timeframe: path}, or None on a cache miss."""
+    try:
+        manifest = json.loads((cache_dir / _REPORT_MANIFEST).read_text(encoding='utf-8'))
+        restored = {}
+        for timeframe, filename in manifest.items():
+            restored[timeframe] = os.path.join(output_dir, filename)
+            shutil.copy(cache_dir / filename, restored[timeframe])
+        return restored
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unusable report cache at '{cache_dir}': {e}")
+        return None
+
+def _store_cached_reports(cache_dir: Path, generated_paths: Dict[str, str]) -> None:
+    """Copies freshly rendered PDFs into the cache; failures only cost the next run a re-render."""
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        for path in generated_paths.values():
+            shutil.copy(path, cache_dir / Path(path).name)
+        manifest = {timeframe: Path(path).name for timeframe, path in generated_paths.items()}
+        (cache_dir / _REPORT_MANIFEST).write_text(json.dumps(manifest), encoding='utf-8')
+        logger.debug(f"Cached rendered reports in: {cache_dir}")
+    except OSError as e:
+        logger.warning(f"Could not cache rendered reports in '{cache_dir}': {e}")
+
 # --- Main Execution Logic ---
 def run_report_generation(args: argparse.Namespace) -> None:
     """
     Orchestrates the 10-K report generation process: setup, data, calculation, PDF generation.
     """
+    # Deferred so that --help and argument errors return without loading Numba/ReportLab
+    try:
+        from src.analysis.quantitative_model import calculate_10k_projections, to_projection_frame
+        from src.reports.report_generator import ReportGenerator, ReportGenerationError, ReportRenderingError
+    except ImportError as e:
+        # The report error types live in the module that failed, so treat this like a fatal generation error
+        logger.exception(f"Fatal Error (ImportError): Could not load calculation/report modules: {e}")
+        print(f"\n❌ ERROR (ImportError): Process Aborted. See log '{log_file}' for details.", file=sys.stderr)
+        sys.exit(1)
+
     try:
         logger.info("="*60)
         logger.info("🚀 Starting BFC 10-K Projection Report Generator (v3)...")
         logger.info("="*60)
 
         # 1. Setup Output Directory
-        output_dir = Path(args.output_dir).resolve() # Get absolute path
+        output_dir = os.path.abspath(args.output_dir) # Absolute path without resolving symlinks
         logger.info(f"Ensuring output directory exists: {output_dir}")
         try:
-            output_dir.mkdir(parents=True, exist_ok=True)
+            os.makedirs(output_dir, exist_ok=True)
             logger.debug(f"Output directory ready at: {output_dir}")
         except OSError as e:
             logger.exception(f"Fatal: Failed to create output directory '{output_dir}'. Error: {e}")
@@ -70,37 +135,55 @@ def run_report_generation(args: argparse.Namespace) -> None:
         if not baseline_data: # Should not happen if get_baseline_data raises error on empty
              logger.error("Fatal: Baseline data could not be loaded.")
              raise ValueError("Failed to load baseline data.")
-        logger.info(f"Baseline data (Year 2018) loaded successfully. Found {len(baseline_data)} metrics.")
-        logger.debug(f"Baseline keys include: {list(baseline_data.keys())[:5]}...") # Log first few keys
+        baseline_fields = [f.name for f in dataclasses.fields(baseline_data)]
+        logger.info(f"Baseline data (Year 2018) loaded successfully. Found {len(baseline_fields)} metrics.")
+        logger.debug(f"Baseline keys include: {baseline_fields[:5]}...") # Log first few keys
 
         # 3. Perform Calculations
         logger.info("Calculating 1, 5, 10-year financial projections...")
         # This function now calculates projections for all timeframes
-        projection_data = calculate_10k_projections(baseline_data, GROWTH_ASSUMPTIONS)
+        projection_data = calculate_10k_projections(baseline_data, GROWTH_TIMEFRAMES)
         if not all(tf in projection_data for tf in ['one_year', 'five_year', 'ten_year']):
              logger.warning("Projection calculations did not return data for all expected timeframes.")
         logger.info("Financial projections calculated.")
         logger.debug(f"Projection data structure keys: {list(projection_data.keys())}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Projection summary:\n{to_projection_frame(projection_data).T.to_string()}")
 
-        # 4. Generate Reports
-        logger.info("Initializing PDF Report Generator...")
-        report_gen = ReportGenerator(str(output_dir))
-        logger.info(f"Generating 10-K reports for timeframes: {list(projection_data.keys() - {'baseline'})}...")
+        # 4. Generate Reports (inputs are constants, so an earlier identical run's PDFs can be reused)
+        report_cache_dir = _report_cache_dir(ReportGenerator)
+        generated_paths: Optional[Dict[str, str]] = _restore_cached_reports(report_cache_dir, output_dir)
+        if generated_paths is not None:
+            logger.info(f"Reused {len(generated_paths)} cached reports from: {report_cache_dir}")
+        else:
+            logger.info("Initializing PDF Report Generator...")
+            # The generator owns a render process pool; the with block shuts it down before exit
+            with ReportGenerator(output_dir) as report_gen:
+                logger.info(f"Generating 10-K reports for timeframes: {list(projection_data.keys() - {'baseline'})}...")
 
-        # generate_10k_reports handles parallelism and error aggregation internally
-        generated_paths: Optional[Dict[str, str]] = report_gen.generate_10k_reports(projection_data)
+                # generate_10k_reports handles parallelism and error aggregation internally
+                generated_paths = report_gen.generate_10k_reports(projection_data)
+            # Only a complete set is cached, so a partial failure is retried next run
+            expected_timeframes = projection_data.keys() - {'baseline'}
+            if generated_paths and set(generated_paths) >= expected_timeframes and \
+                    not any("FAILED:" in path for path in generated_paths.values()):
+                _store_cached_reports(report_cache_dir, generated_paths)
 
         # 5. Summarize Outcome
         logger.info("-" * 60)
         if generated_paths:
-            logger.info("✅ Report Generation Summary:")
+            # One multi-line record instead of one per timeframe; failures keep it at ERROR level
+            summary_lines: List[str] = []
             all_successful = True
             for timeframe, path_or_error in sorted(generated_paths.items()): # Sort output
+                label = timeframe.replace('_',' ').title()
                 if "FAILED:" not in path_or_error:
-                    logger.info(f"  [SUCCESS] {timeframe.replace('_',' ').title():<10} Report -> {Path(path_or_error).name}")
+                    summary_lines.append(f"  [SUCCESS] {label:<10} Report -> {Path(path_or_error).name}")
                 else:
-                    logger.error(f"  [FAILED]  {timeframe.replace('_',' ').title():<10} Report -> {path_or_error}")
+                    summary_lines.append(f"  [FAILED]  {label:<10} Report -> {path_or_error}")
                     all_successful = False
+            logger.log(logging.INFO if all_successful else logging.ERROR,
+                       "✅ Report Generation Summary:\n" + "\n".join(summary_lines))
             if not all_successful:
                  logger.warning("One or more reports failed. Review log entries above for details.")
             print(f"\nReport generation complete. PDFs saved in: {output_dir}")
@@ -3,22 +3,186 @@ Simplified quantitative model focused on calculating projections for 10-K report
 (Version 3 - Refined Docs & Calc Clarity)
 """
 
-from typing import Dict, Any, Union, Optional # Added Optional, Union
+from typing import Dict, Any, List, Union, Optional, Mapping, Sequence, TYPE_CHECKING # Added Optional, Union
+from dataclasses import asdict, astuple, fields
 import logging
+import math
+from functools import lru_cache
+from types import MappingProxyType
+import numpy as np
+
+from src.core.config import TIMEFRAMES, PROJECTION_FIELDS, Baseline, GrowthTimeframe, TimeframeProjection, safe_get_numeric
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+try:
+    from numba import njit, guvectorize
+except ImportError: # Numba is optional; kernels below then run as plain NumPy/Python
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed."""
+        def decorator(func):
+            return func
+        return decorator
+
+    def guvectorize(*args, **kwargs):
+        """Stand-in for numba.guvectorize: broadcasts the inputs and runs the kernel once over the flattened arrays."""
+        def decorator(func):
+            def gufunc(*arrays):
+                arrays = [np.ascontiguousarray(a) for a in np.broadcast_arrays(*arrays)]
+                out = np.empty(arrays[0].shape, dtype=np.float64)
+                func(*(a.reshape(-1) for a in arrays), out.reshape(-1))
+                return out
+            return gufunc
+        return decorator
 
 logger = logging.getLogger(__name__) # Logger for this module
 
-# Helper to safely get numeric values
-def _safe_get_numeric(data: Dict, key: str, default: float = 0.0) -> float:
-    """Safely retrieves a numeric value from a dictionary, logging warnings."""
-    val = data.get(key)
-    if val is None:
-        # logger.debug(f"Key '{key}' not found in data. Using default {default}.") # Debug level maybe
-        return default
-    if not isinstance(val, (int, float)):
-        logger.warning(f"Non-numeric value ('{val}' type: {type(val).__name__}) for key '{key}'. Using default {default}.")
-        return default
-    return float(val)
+# Per timeframe: (horizon in years, assumption key for revenue growth). One-year growth is annual,
+# the longer horizons store cumulative growth; either way it is the total growth over the horizon
+_TF_META = {
+    'one_year': (1, 'revenue_growth_pct'),
+    'five_year': (5, 'cumulative_revenue_growth_pct'),
+    'ten_year': (10, 'cumulative_revenue_growth_pct'),
+}
+_YEARS = np.array([_TF_META[tf][0] for tf in TIMEFRAMES], dtype=np.int64) # Horizon lengths, ordered as TIMEFRAMES
+_PCT = 0.01 # Percent / percentage points -> fraction
+_HALF_PCT = 0.005 # Half a percentage point -> fraction (net margin moves by half the EBITDA improvement)
+_EMPTY: Mapping[str, Any] = MappingProxyType({}) # Shared, read-only result for timeframes without assumptions
+
+def _growth_from_dict(timeframe: str, assumptions: Mapping) -> GrowthTimeframe:
+    """Builds a GrowthTimeframe from a dict; missing or non-numeric fields become 0.0."""
+    return GrowthTimeframe(
+        revenue_growth_pct=safe_get_numeric(assumptions, _TF_META[timeframe][1]),
+        asset_growth_pct=safe_get_numeric(assumptions, 'asset_growth_pct'),
+        liability_growth_pct=safe_get_numeric(assumptions, 'liability_growth_pct'),
+        equity_growth_pct=safe_get_numeric(assumptions, 'equity_growth_pct'),
+        ebitda_margin_improvement=safe_get_numeric(assumptions, 'ebitda_margin_improvement'),
+        r_and_d_increase=safe_get_numeric(assumptions, 'r_and_d_increase'),
+    )
+
+def _build_baseline_vector(baseline: Baseline) -> np.ndarray:
+    """Baseline figures ordered as PROJECTION_FIELDS."""
+    return np.array([getattr(baseline, field) for field in PROJECTION_FIELDS], dtype=np.float64)
+
+def _build_growth_matrix(growth: Mapping[str, GrowthTimeframe]) -> np.ndarray:
+    """Growth percentages as a (timeframes x PROJECTION_FIELDS) matrix; missing timeframes are zero rows."""
+    matrix = np.zeros((len(TIMEFRAMES), len(PROJECTION_FIELDS)), dtype=np.float64)
+    for row, timeframe in enumerate(TIMEFRAMES):
+        g = growth.get(timeframe)
+        if g is not None:
+            matrix[row] = (g.revenue_growth_pct, g.asset_growth_pct, g.liability_growth_pct, g.equity_growth_pct)
+    return matrix
+
+# Explicit signature compiles eagerly at import; cache=True reuses the compiled kernel across runs
+@njit('f8[:,:](f8[:], f8[:,:])', cache=True)
+def _project_balance_kernel(baseline_vec, growth_matrix):
+    """
+    Applies cumulative growth percentages (cols) to the baseline vector for each timeframe (rows).
+
+    No fastmath: the JIT and ahead-of-time builds, and config.PROJECTIONS, evaluate the same
+    expression without fused multiply-adds, so they agree bit for bit.
+    """
+    out = np.empty_like(growth_matrix)
+    for i in range(growth_matrix.shape[0]):
+        for j in range(growth_matrix.shape[1]):
+            out[i, j] = baseline_vec[j] * (1.0 + growth_matrix[i, j] * _PCT)
+    return out
+
+@njit('f8[:,:](f8[:], f8, f8, f8, f8[:], f8[:])', cache=True)
+def _project_core(proj_rev, base_ebitda_margin, base_rnd_spend, base_net_margin, ebitda_margin_improvement_pp, rnd_increase_pct):
+    """
+    Income statement projection per timeframe, as one tight loop over scalars.
+
+    Rows of the result: EBITDA margin, EBITDA, R&D spend, net margin, net income.
+    Margins are kept between a floor of 0 and a ceiling of 100%. Net Income -
+    Simple Assumption: Net Margin improves by *half* the percentage points of
+    EBITDA margin improvement (2.0 p.p. EBITDA -> 1.0 p.p. net); real-world
+    requires projecting taxes, interest etc. No fastmath, so results match
+    the plain NumPy/Python evaluation bit for bit.
+    """
+    out = np.empty((5, proj_rev.shape[0]))
+    for i in range(proj_rev.shape[0]):
+        ebitda_margin = max(0.0, min(1.0, base_ebitda_margin + ebitda_margin_improvement_pp[i] * _PCT))
+        net_margin = max(0.0, min(1.0, base_net_margin + ebitda_margin_improvement_pp[i] * _HALF_PCT))
+        out[0, i] = ebitda_margin
+        out[1, i] = proj_rev[i] * ebitda_margin
+        out[2, i] = base_rnd_spend * (1.0 + rnd_increase_pct[i] * _PCT)
+        out[3, i] = net_margin
+        out[4, i] = proj_rev[i] * net_margin
+    return out
+
+@njit('f8(f8, f8, i8)', cache=True, fastmath=True)
+def _cagr_njit(start_val, end_val, num_years):
+    """Numeric CAGR core in percent; NaN when the inputs cannot give a meaningful rate."""
+    if num_years <= 0 or start_val <= 0.0 or end_val < 0.0:
+        return np.nan
+    if end_val == 0.0: # log(0) is -inf (a ValueError in pure Python); the rate is a total loss
+        return -100.0
+    return math.expm1(math.log(end_val / start_val) / num_years) * 100.0
+
+# Specialized CAGR cores for the model's fixed horizons: a plain ratio for one year, constant scale otherwise.
+# expm1(log(ratio) / years) avoids the cancellation in `ratio**(1/years) - 1` for small growth rates
+@njit('f8(f8, f8)', cache=True)
+def _cagr1(start_val, end_val):
+    return (end_val / start_val - 1.0) * 100.0
+
+@njit('f8(f8, f8)', cache=True)
+def _cagr5(start_val, end_val):
+    if end_val == 0.0:
+        return -100.0
+    return math.expm1(math.log(end_val / start_val) * 0.2) * 100.0
+
+@njit('f8(f8, f8)', cache=True)
+def _cagr10(start_val, end_val):
+    if end_val == 0.0:
+        return -100.0
+    return math.expm1(math.log(end_val / start_val) * 0.1) * 100.0
+
+_CAGR_FUNCS = {1: _cagr1, 5: _cagr5, 10: _cagr10}
+
+@njit('f8[:](f8[:], f8[:], i8[:])', cache=True)
+def _cagr_batch_kernel(start_vals, end_vals, years):
+    """Element-wise `_cagr_njit`; NaN marks invalid elements."""
+    out = np.empty_like(end_vals)
+    for i in range(end_vals.shape[0]):
+        out[i] = _cagr_njit(start_vals[i], end_vals[i], years[i])
+    return out
+
+def _cagr_gufunc_kernel(start_vals, end_vals, years, out):
+    """Loop body of `cagr_gufunc`, compiled on first use by `_parallel_cagr_gufunc`."""
+    for i in range(start_vals.shape[0]):
+        if years[i] <= 0 or start_vals[i] <= 0.0 or end_vals[i] < 0.0:
+            out[i] = np.nan
+        elif end_vals[i] == 0.0:
+            out[i] = -100.0
+        else:
+            out[i] = np.expm1(np.log(end_vals[i] / start_vals[i]) / years[i]) * 100.0
+
+@lru_cache(maxsize=1)
+def _parallel_cagr_gufunc():
+    """
+    Compiles the multi-threaded CAGR gufunc. Deferred to the first batch call, so importing this
+    module (including in the forked report render workers) never loads Numba's parallel runtime.
+    """
+    return guvectorize(['void(f8[:], f8[:], i8[:], f8[:])'], '(n),(n),(n)->(n)', target='parallel',
+                       nopython=True, fastmath=True, cache=True)(_cagr_gufunc_kernel)
+
+def cagr_gufunc(start_vals: np.ndarray, end_vals: np.ndarray, years: np.ndarray) -> np.ndarray:
+    """
+    CAGR (percent) over the last axis of broadcastable (start, end, years) arrays; NaN where invalid.
+
+    Multi-threaded, for sensitivity sweeps over many pairs. Written as
+    expm1(log(end / start) / years) so the loop vectorizes. This can differ
+    from the ** form in the last bits.
+    """
+    return _parallel_cagr_gufunc()(start_vals, end_vals, years)
+
+# Ahead-of-time compiled kernels (built by build_native.py) skip JIT/cache loading in fresh processes
+try:
+    from src.analysis.quantitative_model_native import cagr_batch, project_batch, project_core
+except ImportError: # Not built (or built before project_core) for this platform; use the JIT (or plain Python) kernels above
+    cagr_batch, project_batch, project_core = _cagr_batch_kernel, _project_balance_kernel, _project_core
 
 def _calculate_cagr(start_val: Optional[Union[int, float]],
                     end_val: Optional[Union[int, float]],
@@ -49,118 +213,306 @@ def _calculate_cagr(start_val: Optional[Union[int, float]],
         return "N/A (Negative Value)"
 
     try:
-        # Calculate CAGR: ((End / Start) ^ (1 / Years)) - 1
-        cagr = ((end_val / start_val)**(1.0 / num_years) - 1) * 100.0
-        # Check for potential complex results (e.g., negative base with non-integer power)
-        if isinstance(cagr, complex):
-             logger.error(f"Complex number resulted from CAGR calculation: {start_val}, {end_val}, {num_years}")
-             return "N/A (Calculation Error)"
+        # Calculate CAGR: ((End / Start) ^ (1 / Years)) - 1, evaluated as expm1(ln(End / Start) / Years);
+        # inputs are validated above, so the kernel never sees NaN cases
+        kernel = _CAGR_FUNCS.get(num_years)
+        if kernel is not None:
+            cagr = kernel(float(start_val), float(end_val))
+        else:
+            cagr = _cagr_njit(float(start_val), float(end_val), num_years)
+        if math.isinf(cagr): # Compiled pow overflows to inf where Python's ** raised OverflowError
+            raise OverflowError("CAGR overflowed")
         return cagr
-    except (ValueError, OverflowError, ZeroDivisionError) as e:
+    except OverflowError as e: # Zero/negative bases and years are rejected above, so overflow is the only failure left
          logger.error(f"Error calculating CAGR ({start_val=}, {end_val=}, {num_years=}): {e}")
          return "N/A (Calculation Error)"
 
 
-def calculate_10k_projections(baseline_data: Dict[str, Any], growth_assumptions: Dict[str, Any]) -> Dict[str, Any]:
+def _calculate_cagr_vector(start_val: float, end_vals: np.ndarray, years: np.ndarray) -> List[Union[float, str]]:
+    """
+    Element-wise `_calculate_cagr` for one start value against an array of end values.
+
+    The start value is shared by every element, so it is validated once; the
+    numeric part is a single array expression.
+    """
+    if start_val == 0:
+        return ["N/A (Zero Base)"] * len(end_vals)
+    if start_val < 0:
+        return ["N/A (Negative Value)"] * len(end_vals)
+    cagr = cagr_batch(np.full(len(end_vals), float(start_val)), end_vals, years) # NaN for negative ends; replaced below
+    return ["N/A (Negative Value)" if end < 0 else value
+            for end, value in zip(end_vals.tolist(), cagr.tolist())]
+
+def compute_projection_derived(baseline_arr: Sequence[float], proj_arr: Sequence[float], years: int) -> np.ndarray:
+    """
+    CAGR (percent) of each projected value against its baseline value over `years`; NaN where undefined.
+
+    One call into the compiled batch kernel for all pairs, e.g. revenue, EBITDA,
+    net income and R&D, for consumers that receive projections without CAGRs.
+    """
+    start_vals = np.asarray(baseline_arr, dtype=np.float64)
+    end_vals = np.asarray(proj_arr, dtype=np.float64)
+    return cagr_batch(start_vals, end_vals, np.full(end_vals.shape[0], years, dtype=np.int64))
+
+
+def _calculate_10k_projections(baseline_data: Union[Baseline, Mapping[str, Any]],
+                               growth_assumptions: Mapping[str, Union[GrowthTimeframe, Mapping[str, Any]]],
+                               return_soa: bool = False, copy_baseline: bool = False,
+                               as_records: bool = False) -> Dict[str, Any]:
+    """Uncached body of `calculate_10k_projections`."""
+    logger.debug("Starting projection calculations...")
+    # Normalize inputs to the typed records; dict inputs go through the safe numeric conversion once
+    if isinstance(baseline_data, Baseline):
+        baseline = baseline_data
+        results: Dict[str, Any] = {'baseline': asdict(baseline)}
+    else:
+        baseline = Baseline.from_dict(baseline_data)
+        # Read-only view instead of a copy; the function never mutates baseline_data
+        results = {'baseline': dict(baseline_data) if copy_baseline else MappingProxyType(baseline_data)}
+    growth: Dict[str, GrowthTimeframe] = {
+        timeframe: a if isinstance(a, GrowthTimeframe) else _growth_from_dict(timeframe, a)
+        for timeframe, a in growth_assumptions.items()
+        if timeframe in TIMEFRAMES
+    }
+
+    # --- Baseline Figures Extraction ---
+    base_revenue = baseline.revenue
+    base_ebitda = baseline.ebitda
+    base_ebitda_margin = baseline.ebitda_margin
+    base_rnd_spend = baseline.r_and_d_spend
+    base_net_income = baseline.net_income
+    base_net_margin = baseline.net_margin
+    logger.debug("Using Baseline - Revenue: %.1fM, EBITDA: %.1fM, Net Income: %.1fM, R&D: %.1fM",
+                 base_revenue, base_ebitda, base_net_income, base_rnd_spend)
+
+    # --- Vectorized Revenue & Balance Sheet Projection ---
+    # rows = TIMEFRAMES, cols = PROJECTION_FIELDS; one compiled kernel call instead of per-field scalar math
+    growth_matrix = _build_growth_matrix(growth)
+    balance_projection = project_batch(_build_baseline_vector(baseline), growth_matrix)
+
+    # --- Income Statement Projection ---
+    # One compiled loop over all timeframes; missing timeframes get zero rows and are skipped below
+    ebitda_margin_improvement_pp = np.array([growth[tf].ebitda_margin_improvement if tf in growth else 0.0 for tf in TIMEFRAMES])
+    rnd_increase_pct = np.array([growth[tf].r_and_d_increase if tf in growth else 0.0 for tf in TIMEFRAMES])
+
+    # Revenue: cumulative growth, Projected = Base * (1 + Cumulative Rate), taken from the kernel above
+    proj_rev = balance_projection[:, 0]
+    proj_ebitda_margin, proj_ebitda, proj_rnd, proj_net_margin, proj_net_income = project_core(
+        proj_rev, base_ebitda_margin, base_rnd_spend, base_net_margin, ebitda_margin_improvement_pp, rnd_increase_pct)
+
+    revenue_cagr = _calculate_cagr_vector(base_revenue, proj_rev, _YEARS)
+    ebitda_cagr = _calculate_cagr_vector(base_ebitda, proj_ebitda, _YEARS)
+    rnd_cagr = _calculate_cagr_vector(base_rnd_spend, proj_rnd, _YEARS)
+    net_income_cagr = _calculate_cagr_vector(base_net_income, proj_net_income, _YEARS)
+
+    # --- Struct-of-Arrays Results ---
+    # One column per metric, one row per timeframe that has assumptions (in TIMEFRAMES order)
+    present = np.array([tf in growth for tf in TIMEFRAMES])
+    soa: Dict[str, np.ndarray] = {
+        'timeframe': np.array(TIMEFRAMES),
+        'projected_revenue': proj_rev,
+        'revenue_cagr': np.array(revenue_cagr, dtype=object),
+        'projected_ebitda': proj_ebitda,
+        'projected_ebitda_margin': proj_ebitda_margin,
+        'ebitda_cagr': np.array(ebitda_cagr, dtype=object),
+        'projected_r_and_d_spend': proj_rnd,
+        'rnd_cagr': np.array(rnd_cagr, dtype=object),
+        'projected_net_income': proj_net_income,
+        'projected_net_margin': proj_net_margin, # Store projected margin
+        'net_income_cagr': np.array(net_income_cagr, dtype=object),
+    }
+    # Balance sheet totals
+    for col, field in enumerate(PROJECTION_FIELDS[1:], start=1):
+        soa[f'projected_{field}'] = balance_projection[:, col]
+    soa = {metric: column[present] for metric, column in soa.items()} # Boolean indexing also copies
+    if return_soa:
+        logger.debug("Projection calculations finished.")
+        return soa
+
+    # --- Per-Timeframe Results (row view of the columns above) ---
+    columns = {metric: column.tolist() for metric, column in soa.items() if metric != 'timeframe'}
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    row = 0
+    for timeframe in TIMEFRAMES:
+        if timeframe not in growth:
+            logger.warning("Growth assumptions missing for timeframe: %s. Skipping.", timeframe)
+            results[timeframe] = None if as_records else _EMPTY
+            continue
+
+        projections: Dict[str, Any] = {metric: values[row] for metric, values in columns.items()}
+        row += 1
+
+        if debug_enabled: # One check per timeframe instead of formatting five records that are dropped
+            logger.debug("  %s Revenue -> %.1fM (CAGR: %s)", timeframe, projections['projected_revenue'], projections['revenue_cagr'])
+            logger.debug("  %s EBITDA -> %.1fM (Margin: %.1f%%, CAGR: %s)", timeframe, projections['projected_ebitda'],
+                         projections['projected_ebitda_margin'] * 100, projections['ebitda_cagr'])
+            logger.debug("  %s R&D Spend -> %.1fM (CAGR: %s)", timeframe, projections['projected_r_and_d_spend'], projections['rnd_cagr'])
+            logger.debug("  %s Net Income -> %.1fM (Margin: %.1f%%, CAGR: %s)", timeframe, projections['projected_net_income'],
+                         projections['projected_net_margin'] * 100, projections['net_income_cagr'])
+            logger.debug("  (Net Income projection based on assumed margin improvement: %.2f p.p.)",
+                         growth[timeframe].ebitda_margin_improvement / 2.0)
+
+        # --- Store Results ---
+        results[timeframe] = TimeframeProjection(**projections) if as_records else projections
+
+    logger.debug("Projection calculations finished.")
+    return results
+
+def _freeze(data: Union[Baseline, GrowthTimeframe, Mapping[str, Any]], sort: bool = False) -> Any:
+    """Hashable stand-in for a projection input; typed records are already hashable."""
+    if isinstance(data, (Baseline, GrowthTimeframe)):
+        return data
+    return tuple(sorted(data.items())) if sort else tuple(data.items())
+
+@lru_cache(maxsize=256)
+def _calculate_cached(baseline_key: Any, growth_key: tuple, return_soa: bool, as_records: bool) -> Dict[str, Any]:
+    """Projections for frozen inputs; callers must copy the result before handing it out."""
+    baseline = baseline_key if isinstance(baseline_key, Baseline) else dict(baseline_key)
+    growth = {tf: g if isinstance(g, GrowthTimeframe) else dict(g) for tf, g in growth_key}
+    return _calculate_10k_projections(baseline, growth, return_soa, as_records=as_records)
+
+def calculate_10k_projections(baseline_data: Union[Baseline, Mapping[str, Any]],
+                              growth_assumptions: Mapping[str, Union[GrowthTimeframe, Mapping[str, Any]]],
+                              return_soa: bool = False, copy_baseline: bool = False,
+                              as_records: bool = False) -> Dict[str, Any]:
     """
     Calculates projected financial figures for 1, 5, 10-year horizons.
 
     Projects Revenue, EBITDA, R&D Spend, and Net Income based on baseline data
     and growth assumptions defined per timeframe. Also calculates implied CAGR
-    for each projected metric.
+    for each projected metric. Revenue and balance sheet totals (assets,
+    liabilities, equity) for all timeframes are computed in a single
+    (Numba-compiled, when available) kernel call; the income statement
+    metrics and their CAGRs are array expressions across all timeframes.
 
     Args:
-        baseline_data: Dictionary of baseline (e.g., 2018) financial figures.
+        baseline_data: Baseline record, or dictionary of baseline (e.g., 2018) financial figures.
                        Expected keys: 'revenue', 'ebitda', 'ebitda_margin',
                                       'r_and_d_spend', 'net_income'.
         growth_assumptions: Dictionary containing growth factors per timeframe.
                             Keys: 'one_year', 'five_year', 'ten_year'.
-                            Each timeframe dict expected keys: 'revenue_growth_pct' or
-                            'cumulative_revenue_growth_pct', 'ebitda_margin_improvement',
-                            'r_and_d_increase'.
+                            Each value is a GrowthTimeframe, or a dict with keys
+                            'revenue_growth_pct' or 'cumulative_revenue_growth_pct',
+                            'ebitda_margin_improvement', 'r_and_d_increase'.
+        return_soa: If True, return the projections column-wise instead (see Returns).
+        copy_baseline: If True, results['baseline'] is a mutable dict copy of a
+                       mapping `baseline_data` rather than a read-only view.
+        as_records: If True, each timeframe entry is a frozen TimeframeProjection
+                    record (None for missing timeframes) instead of a dict.
+
+    Results are memoized on the input values, so repeated calls with the same
+    baseline and assumptions (scenario re-runs, report regeneration) skip the
+    computation; each call still gets its own copy of the result dicts.
 
     Returns:
-        Dictionary containing baseline data ('baseline' key) and calculated
+        Dictionary containing baseline data ('baseline' key; a dict for Baseline
+        input, otherwise a read-only MappingProxyType unless copy_baseline) and calculated
         projections ('one_year', 'five_year', 'ten_year' keys). Each timeframe
         projection includes 'projected_revenue', 'projected_ebitda',
-        'projected_r_and_d_spend', 'projected_net_income', and their '..._cagr'.
+        'projected_r_and_d_spend', 'projected_net_income', and their '..._cagr',
+        plus 'projected_assets', 'projected_liabilities', 'projected_equity'.
+        Timeframes without assumptions map to the shared, read-only empty
+        mapping `_EMPTY`, i.e. `results[tf] is _EMPTY`.
+
+        With return_soa=True: a dict of NumPy arrays, one per metric above plus
+        'timeframe', with one row per timeframe that has assumptions (in
+        TIMEFRAMES order). CAGR columns are object arrays, since they may hold
+        N/A strings. The baseline is not included.
     """
-    logger.debug("Starting projection calculations...")
-    results: Dict[str, Any] = {'baseline': baseline_data.copy()} # Start with baseline copy
+    try:
+        # Baseline keeps its key order (it is copied into results['baseline']); assumption order is irrelevant
+        baseline_key = _freeze(baseline_data)
+        growth_key = tuple(sorted((tf, _freeze(a, sort=True)) for tf, a in growth_assumptions.items()))
+        hash((baseline_key, growth_key))
+    except TypeError: # Unhashable values somewhere in the inputs; compute without the cache
+        return _calculate_10k_projections(baseline_data, growth_assumptions, return_soa, copy_baseline, as_records)
+    cached = _calculate_cached(baseline_key, growth_key, return_soa, as_records)
+    if return_soa:
+        return {metric: column.copy() for metric, column in cached.items()}
+    # Two-level copy is enough: the leaves are floats and N/A strings. Frozen records and the
+    # read-only baseline view (over the cache's own dict, rebuilt from the key) are shared as-is
+    return {key: value if value is None or value is _EMPTY or isinstance(value, TimeframeProjection)
+                 or (isinstance(value, MappingProxyType) and not copy_baseline) else dict(value)
+            for key, value in cached.items()}
 
-    # --- Baseline Figures Extraction ---
-    # Use safe_get to handle potential missing keys gracefully
-    base_revenue = _safe_get_numeric(baseline_data, 'revenue')
-    base_ebitda = _safe_get_numeric(baseline_data, 'ebitda')
-    base_ebitda_margin = _safe_get_numeric(baseline_data, 'ebitda_margin')
-    base_rnd_spend = _safe_get_numeric(baseline_data, 'r_and_d_spend')
-    base_net_income = _safe_get_numeric(baseline_data, 'net_income')
-    # Calculate baseline net margin only if needed and possible
-    base_net_margin = (base_net_income / base_revenue) if base_revenue != 0 else 0.0
-    logger.debug(f"Using Baseline - Revenue: {base_revenue:.1f}M, EBITDA: {base_ebitda:.1f}M, Net Income: {base_net_income:.1f}M, R&D: {base_rnd_spend:.1f}M")
-
-    # --- Projection Loop ---
-    for timeframe in ['one_year', 'five_year', 'ten_year']:
-        logger.debug(f"Calculating projections for: {timeframe}")
-        if timeframe not in growth_assumptions:
-            logger.warning(f"Growth assumptions missing for timeframe: {timeframe}. Skipping.")
-            results[timeframe] = {} # Store empty dict
-            continue
+# Columns of the batch result, in the same order as the per-timeframe projection dicts
+_BATCH_FIELDS = tuple(f.name for f in fields(TimeframeProjection))
+_BATCH_DTYPE = np.dtype([(name, np.float64) for name in _BATCH_FIELDS])
 
-        assumptions: Dict = growth_assumptions[timeframe]
-        projections: Dict[str, Any] = {} # Initialize dict for this timeframe's projections
-        years: int = {'one_year': 1, 'five_year': 5, 'ten_year': 10}.get(timeframe, 0)
+def _cagr_grid(start_val: float, end_vals: np.ndarray) -> np.ndarray:
+    """CAGR (percent) for an (S, timeframes) grid of end values; NaN where it is not meaningful."""
+    return cagr_gufunc(np.full(end_vals.shape, float(start_val)), end_vals, _YEARS)
 
-        # --- 1. Revenue Projection ---
-        proj_rev: float = 0.0
-        if timeframe == 'one_year':
-            rev_growth_pct = _safe_get_numeric(assumptions, 'revenue_growth_pct', 0.0)
-            proj_rev = base_revenue * (1 + rev_growth_pct / 100.0)
-        else:
-            # Cumulative growth: Projected = Base * (1 + Cumulative Rate)
-            cum_rev_growth_pct = _safe_get_numeric(assumptions, 'cumulative_revenue_growth_pct', 0.0)
-            proj_rev = base_revenue * (1 + cum_rev_growth_pct / 100.0)
-        projections['projected_revenue'] = proj_rev
-        projections['revenue_cagr'] = _calculate_cagr(base_revenue, proj_rev, years)
-        logger.debug(f"  {timeframe} Revenue -> {proj_rev:.1f}M (CAGR: {projections['revenue_cagr']})")
-
-
-        # --- 2. EBITDA Projection ---
-        ebitda_margin_improvement_pp = _safe_get_numeric(assumptions, 'ebitda_margin_improvement', 0.0)
-        # Ensure projected margin doesn't go below a reasonable floor (e.g., 0) or above ceiling (e.g., 100%)
-        proj_ebitda_margin = max(0.0, min(1.0, base_ebitda_margin + (ebitda_margin_improvement_pp / 100.0)))
-        proj_ebitda = proj_rev * proj_ebitda_margin
-        projections['projected_ebitda'] = proj_ebitda
-        projections['projected_ebitda_margin'] = proj_ebitda_margin
-        projections['ebitda_cagr'] = _calculate_cagr(base_ebitda, proj_ebitda, years)
-        logger.debug(f"  {timeframe} EBITDA -> {proj_ebitda:.1f}M (Margin: {proj_ebitda_margin*100:.1f}%, CAGR: {projections['ebitda_cagr']})")
-
-
-        # --- 3. R&D Spend Projection ---
-        rnd_increase_pct = _safe_get_numeric(assumptions, 'r_and_d_increase', 0.0)
-        proj_rnd = base_rnd_spend * (1 + rnd_increase_pct / 100.0)
-        projections['projected_r_and_d_spend'] = proj_rnd
-        projections['rnd_cagr'] = _calculate_cagr(base_rnd_spend, proj_rnd, years)
-        logger.debug(f"  {timeframe} R&D Spend -> {proj_rnd:.1f}M (CAGR: {projections['rnd_cagr']})")
-
-
-        # --- 4. Net Income Projection ---
-        # Simple Assumption: Net Margin improves by *half* the percentage points of EBITDA margin improvement.
-        # Example: If EBITDA margin improves by 2.0 p.p., assume Net Margin improves by 1.0 p.p.
-        # This is a simplistic approach; real-world requires projecting taxes, interest etc.
-        net_margin_improvement_pp = ebitda_margin_improvement_pp / 2.0 # Assumption!
-        # Ensure projected margin stays within reasonable bounds (e.g., 0% to 100%)
-        proj_net_margin = max(0.0, min(1.0, base_net_margin + (net_margin_improvement_pp / 100.0)))
-        proj_net_income = proj_rev * proj_net_margin
-        projections['projected_net_income'] = proj_net_income
-        projections['projected_net_margin'] = proj_net_margin # Store projected margin
-        projections['net_income_cagr'] = _calculate_cagr(base_net_income, proj_net_income, years)
-        logger.debug(f"  {timeframe} Net Income -> {proj_net_income:.1f}M (Margin: {proj_net_margin*100:.1f}%, CAGR: {projections['net_income_cagr']})")
-        logger.debug(f"  (Net Income projection based on assumed margin improvement: {net_margin_improvement_pp:.2f} p.p.)")
+def calculate_10k_projections_batch(baseline_data: Union[Baseline, Mapping[str, Any]],
+                                    scenarios: Sequence[Mapping[str, Union[GrowthTimeframe, Mapping[str, Any]]]]) -> np.ndarray:
+    """
+    Projects many growth-assumption scenarios (e.g. bull/base/bear, Monte-Carlo draws) in one pass.
 
+    Uses the same model as `calculate_10k_projections`, broadcast over a
+    (scenarios x timeframes) grid instead of looping per scenario.
 
-        # --- Store Results ---
-        results[timeframe] = projections
+    Args:
+        baseline_data: Baseline record or dictionary, as for `calculate_10k_projections`.
+        scenarios: Sequence of growth-assumption mappings, each shaped like
+                   `calculate_10k_projections`'s `growth_assumptions`.
 
-    logger.debug("Projection calculations finished.")
-    return results
\ No newline at end of file
+    Returns:
+        Structured array of shape (len(scenarios), len(TIMEFRAMES)) with one
+        float field per projection metric (see `_BATCH_FIELDS`), e.g.
+        `result['projected_revenue'][s, TIMEFRAMES.index('ten_year')]`.
+        CAGRs that cannot be computed are NaN rather than N/A strings, and
+        every field is NaN for timeframes a scenario has no assumptions for.
+    """
+    baseline = baseline_data if isinstance(baseline_data, Baseline) else Baseline.from_dict(baseline_data)
+    # assumptions[s, t] = GrowthTimeframe fields; present[s, t] marks timeframes the scenario defines
+    assumptions = np.zeros((len(scenarios), len(TIMEFRAMES), len(fields(GrowthTimeframe))), dtype=np.float64)
+    present = np.zeros(assumptions.shape[:2], dtype=bool)
+    for s, scenario in enumerate(scenarios):
+        for t, timeframe in enumerate(TIMEFRAMES):
+            a = scenario.get(timeframe)
+            if a is None:
+                continue
+            g = a if isinstance(a, GrowthTimeframe) else _growth_from_dict(timeframe, a)
+            assumptions[s, t] = astuple(g)
+            present[s, t] = True
+
+    base_net_margin = baseline.net_margin
+    ebitda_margin_improvement = assumptions[..., 4]
+    # Revenue and balance sheet totals: growth columns 0-3 line up with PROJECTION_FIELDS
+    balance = _build_baseline_vector(baseline) * (1 + assumptions[..., :len(PROJECTION_FIELDS)] * _PCT)
+    proj_rev = balance[..., 0]
+    proj_ebitda_margin = np.clip(baseline.ebitda_margin + ebitda_margin_improvement * _PCT, 0.0, 1.0)
+    proj_ebitda = proj_rev * proj_ebitda_margin
+    proj_rnd = baseline.r_and_d_spend * (1 + assumptions[..., 5] * _PCT)
+    proj_net_margin = np.clip(base_net_margin + ebitda_margin_improvement * _HALF_PCT, 0.0, 1.0)
+    proj_net_income = proj_rev * proj_net_margin
+
+    out = np.empty(present.shape, dtype=_BATCH_DTYPE)
+    columns = {
+        'projected_revenue': proj_rev,
+        'revenue_cagr': _cagr_grid(baseline.revenue, proj_rev),
+        'projected_ebitda': proj_ebitda,
+        'projected_ebitda_margin': proj_ebitda_margin,
+        'ebitda_cagr': _cagr_grid(baseline.ebitda, proj_ebitda),
+        'projected_r_and_d_spend': proj_rnd,
+        'rnd_cagr': _cagr_grid(baseline.r_and_d_spend, proj_rnd),
+        'projected_net_income': proj_net_income,
+        'projected_net_margin': proj_net_margin,
+        'net_income_cagr': _cagr_grid(baseline.net_income, proj_net_income),
+    }
+    for col, field in enumerate(PROJECTION_FIELDS[1:], start=1):
+        columns[f'projected_{field}'] = balance[..., col]
+    for name, values in columns.items():
+        out[name] = np.where(present, values, np.nan)
+    return out
+
+def to_projection_frame(projection_data: Mapping[str, Any]) -> 'pd.DataFrame':
+    """
+    Returns the timeframe projections as a DataFrame (index = timeframes, columns = metrics).
+
+    `frame.to_dict('index')` gives back the per-timeframe dicts that the report
+    generator consumes, so callers can move to `.loc[timeframe]` incrementally.
+    """
+    import pandas as pd # Imported lazily; only tabular consumers need pandas
+    rows = {timeframe: projection_data[timeframe] for timeframe in TIMEFRAMES if projection_data.get(timeframe)}
+    return pd.DataFrame.from_dict(rows, orient='index')
@@ -3,58 +3,139 @@ Report generation module focused ONLY on 1, 5, 10-year 10-K style projection rep
 (Version 3 - Refined Structure & Formatting)
 """
 
+import copy
+import hashlib
+import io
+import json
 import logging
-from typing import Dict, Any, List, Optional, Union
+import multiprocessing
+from typing import Dict, Any, List, Mapping, Optional, Tuple, Union, TYPE_CHECKING
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor
-import threading
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, BaseDocTemplate, Frame, PageTemplate, KeepTogether
-)
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT, TA_JUSTIFY
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed, wait
+from functools import lru_cache, partial
 
-# Assuming config is not directly needed here anymore
+# ReportLab is imported inside the functions that use it, so importing this module stays cheap
+# for code paths that never build a report
+if TYPE_CHECKING:
+    from reportlab.lib.styles import StyleSheet1
+    from reportlab.platypus import Table, TableStyle
 
 logger = logging.getLogger(__name__)
 
 # --- Helper function to safely get data ---
 def safe_get(data_dict: Dict, key: str, default: Any = None) -> Any:
     """Safely get a value from dictionary, return default if missing."""
+    # Kept for external callers; the report code calls .get on the mapping directly
     return data_dict.get(key, default)
 
+# (CAGR key, baseline key, projected key) for the growth rates shown in the reports
+_CAGR_KEYS: Tuple[Tuple[str, str, str], ...] = (
+    ('revenue_cagr', 'revenue', 'projected_revenue'),
+    ('ebitda_cagr', 'ebitda', 'projected_ebitda'),
+    ('net_income_cagr', 'net_income', 'projected_net_income'),
+    ('rnd_cagr', 'r_and_d_spend', 'projected_r_and_d_spend'),
+)
+
+def derive_missing_cagrs(baseline: Dict, projections: Dict, years: int) -> Dict[str, float]:
+    """
+    Computes the CAGRs absent from `projections` in one compiled call; undefined ones are left out.
+
+    Projections from calculate_10k_projections already carry every CAGR, so this
+    only does work for externally supplied projection data.
+    """
+    missing = [(cagr_key, baseline.get(base_key), projections.get(proj_key))
+               for cagr_key, base_key, proj_key in _CAGR_KEYS if cagr_key not in projections]
+    missing = [(k, b, p) for k, b, p in missing if isinstance(b, (int, float)) and isinstance(p, (int, float))]
+    if not missing or years <= 0:
+        return {}
+    # Deferred so the report module only loads the numeric kernels when it needs them
+    from src.analysis.quantitative_model import compute_projection_derived
+    cagrs = compute_projection_derived([b for _, b, _ in missing], [p for _, _, p in missing], years)
+    return {k: value for (k, _, _), value in zip(missing, cagrs.tolist()) if value == value} # value == value drops NaN
+
 # --- Helper for formatting numbers ---
+# Values are numeric on the happy path, so the formatters try the format first
+# and only fall back to the default when formatting fails (None, strings, ...).
 def format_currency(value: Any, default_str: str = "N/A") -> str:
     """Formats numeric value as currency string ($M) with 1 decimal."""
-    if isinstance(value, (int, float)):
-        sign = "-" if value < 0 else ""
-        return f"{sign}${abs(value):,.1f}M"
-    return default_str
+    try:
+        return f"-${-value:,.1f}M" if value < 0 else f"${abs(value):,.1f}M"
+    except (TypeError, ValueError):
+        return default_str
 
 def format_percent(value: Any, decimals: int = 1, default_str: str = "N/A") -> str:
     """Formats numeric value as percentage string (assumes value is already %)."""
-    if isinstance(value, (int, float)):
+    try:
         return f"{value:.{decimals}f}%"
-    if isinstance(value, str) and value.startswith("N/A"): # Pass through specific N/A strings
-         return value
-    return default_str
+    except (TypeError, ValueError):
+        if isinstance(value, str) and value.startswith("N/A"): # Pass through specific N/A strings
+            return value
+        return default_str
 
 def format_percent_from_decimal(value: Any, decimals: int = 1, default_str: str = "N/A") -> str:
     """Formats numeric value (decimal form, e.g., 0.15) as percentage string."""
-    if isinstance(value, (int, float)):
-         # Ensure value is treated as decimal (e.g., 0.15 -> 15.0%)
-         return f"{value * 100.0:.{decimals}f}%"
-    return default_str
+    try:
+        # Ensure value is treated as decimal (e.g., 0.15 -> 15.0%)
+        return f"{value * 100.0:.{decimals}f}%"
+    except (TypeError, ValueError):
+        return default_str
 
 def format_points(value: Any, decimals: int = 2, default_str: str = "N/A") -> str:
-     """Formats numeric value as percentage points (p.p.) with sign."""
-     if isinstance(value, (int, float)):
-          sign = "+" if value >= 0 else "" # Add + sign for non-negative improvement
-          return f"{sign}{value:.{decimals}f} p.p."
-     return default_str
+    """Formats numeric value as percentage points (p.p.) with sign."""
+    try:
+        return f"{value:+.{decimals}f} p.p." # '+' sign for non-negative improvement
+    except (TypeError, ValueError):
+        return default_str
+
+def format_baseline(baseline: Dict) -> Dict[str, str]:
+    """Formats the baseline figures shown in the reports; identical for every timeframe."""
+    return {
+        'revenue': format_currency(baseline.get('revenue')),
+        'ebitda': format_currency(baseline.get('ebitda')),
+        'net_income': format_currency(baseline.get('net_income')),
+        'r_and_d_spend': format_currency(baseline.get('r_and_d_spend')),
+        'ebitda_margin': format_percent_from_decimal(baseline.get('ebitda_margin', 0)),
+    }
+
+@lru_cache(maxsize=1)
+def _renderer_digest() -> str:
+    """sha256 of this module's source, so editing the templates or layout invalidates built reports."""
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+def _content_hash(timeframe_data: Mapping[str, Any], timeframe: str) -> str:
+    """sha256 of everything one timeframe report is rendered from: its baseline, projections and the renderer."""
+    payload = {'timeframe': timeframe,
+               'baseline': timeframe_data.get('baseline', {}),
+               'projections': timeframe_data.get(timeframe, {}),
+               'renderer': _renderer_digest()}
+    encoded = json.dumps(payload, sort_keys=True,
+                         default=lambda o: dict(o) if isinstance(o, Mapping) else str(o)).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+def _build_record_path(output_path: Path) -> Path:
+    """Build record for one output PDF, kept under CACHE_DIR so the output directory holds only reports."""
+    from src.core.config import CACHE_DIR
+    key = hashlib.sha256(str(output_path.resolve()).encode('utf-8')).hexdigest()[:16]
+    return Path(CACHE_DIR) / 'built_reports' / f"{key}.json"
+
+def _is_up_to_date(output_path: Path, content_hash: str) -> bool:
+    """True when the PDF at output_path is byte-for-byte the one last built from these inputs."""
+    try:
+        record = json.loads(_build_record_path(output_path).read_text(encoding='utf-8'))
+        return record.get('inputs') == content_hash and \
+            record.get('pdf') == hashlib.sha256(output_path.read_bytes()).hexdigest()
+    except (OSError, ValueError): # No (readable) record or PDF; build as usual
+        return False
+
+def _write_build_record(output_path: Path, content_hash: str, pdf_bytes: bytes) -> None:
+    """Records what the PDF at output_path was built from; failures only cost the next call a rebuild."""
+    record_path = _build_record_path(output_path)
+    try:
+        record_path.parent.mkdir(parents=True, exist_ok=True)
+        record_path.write_text(json.dumps({'inputs': content_hash, 'pdf': hashlib.sha256(pdf_bytes).hexdigest()}),
+                               encoding='utf-8')
+    except OSError as e:
+        logger.warning(f"Could not write build record '{record_path}': {e}")
 
 # --- Exceptions ---
 class ReportGenerationError(Exception):
@@ -65,6 +146,236 @@ class ReportRenderingError(ReportGenerationError):
     """Exception for PDF rendering errors."""
     pass
 
+# --- Static Report Text ---
+# Disclaimer & basis of preparation; {horizon} is the timeframe in words (e.g. "five year")
+_DISCLAIMER_TEMPLATE = """
+        <b>Disclaimer:</b> This document contains forward-looking statements and financial projections based on internal assumptions and methodologies. It is intended for illustrative and planning purposes only and does not constitute a formal SEC filing or audited financial statement. Actual results may differ materially due to various risks and uncertainties. This document should not be relied upon for investment decisions.
+        <br/><br/>
+        <b>Basis of Preparation:</b> Projections are derived from the company's 2018 baseline financial data and apply management's growth assumptions for revenue, EBITDA margin improvement, and R&D investment increases specific to the {horizon} horizon. Net income is projected based on simplified margin assumptions linked to EBITDA margin changes. Calculations do not constitute a full financial model. Key assumptions are detailed within relevant sections.
+        """
+
+# Risk factor categories shared by every timeframe: (bold category title, risks)
+_RISK_CATEGORIES_BASE: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("<b>Market & Competition Risks:</b>", (
+        "Shifts in consumer preferences, beauty trends, or spending power.",
+        "Intensified competition from established global players and emerging/niche brands, potentially leading to price pressures or market share erosion.",
+        "Failure to adapt to evolving retail channels (e.g., D2C, social commerce, traditional retail dynamics).",
+    )),
+    ("<b>Operational & Supply Chain Risks:</b>", (
+        "Disruptions in sourcing key raw materials or packaging components.",
+        "Manufacturing capacity constraints or quality control issues.",
+        "Logistics and transportation challenges impacting cost and delivery.",
+        "Cybersecurity incidents affecting operations, customer data, or intellectual property.",
+    )),
+    ("<b>Macroeconomic & Geopolitical Risks:</b>", (
+        "Global or regional economic downturns impacting consumer demand.",
+        "Persistent inflation affecting input costs and consumer prices.",
+        "Significant adverse fluctuations in foreign currency exchange rates.",
+        "Changes in international trade regulations, tariffs, or geopolitical instability in key markets.",
+    )),
+    ("<b>Strategic & Execution Risks:</b>", (
+        "Inability to successfully develop and launch innovative, commercially viable products.",
+        "Ineffective marketing campaigns or damage to brand reputation.",
+        "Challenges in implementing digital transformation initiatives or integrating new technologies.",
+        "Difficulties in attracting and retaining key talent.",
+    )),
+    ("<b>Regulatory & Compliance Risks:</b>", (
+        "Changes in regulations regarding cosmetic ingredients, safety testing, advertising standards, or environmental compliance.",
+        "Increased scrutiny or regulations related to data privacy and protection.",
+    )),
+)
+
+# Extra category for the five- and ten-year reports; {horizon} as above
+_LONG_TERM_RISKS_TITLE = "<b>Longer-Term & Emerging Risks:</b>"
+_LONG_TERM_RISKS: Tuple[str, ...] = (
+    "Fundamental shifts in technology impacting product development or customer interaction.",
+    "Significant demographic changes affecting target consumer groups.",
+    "Challenges in meeting ambitious long-term ({horizon}) sustainability goals.",
+    "Impact of climate change on supply chains or consumer behavior.",
+)
+
+# Item 7 (MD&A) sub-sections as (title, body template); the bodies are filled with
+# str.format_map from the values built in _build_mdna_section
+_MDNA_SECTIONS: Tuple[Tuple[str, str], ...] = (
+    # Introduction
+    ("<u>Introduction and Basis of Projection</u>", """
+        This MD&A discusses projected financial trends for BFC over the {horizon} horizon, based on 2018 baseline data and specified growth assumptions. These projections are illustrative, forward-looking, and subject to risks. They do not represent formal guidance or audited forecasts. Key assumptions involve revenue growth (driven by market factors and strategic initiatives), targeted improvements in EBITDA margin through operational leverage and efficiency, and increased R&D investment to foster innovation.
+        """),
+    # Projected Results with CAGR Commentary
+    ("<u>Projected Financial Performance</u>", """
+        <b>Revenue:</b> Projected to reach {proj_rev}, representing an implied CAGR of {revenue_cagr}. Achieving this growth depends on factors like successful product launches, effective marketing, digital channel performance, and overall market conditions.
+        <br/><br/>
+        <b>Profitability:</b> EBITDA is projected at {proj_ebitda} with an anticipated margin of {proj_ebitda_margin}. The implied EBITDA CAGR is {ebitda_cagr}. Net Income is projected at {proj_net_income} (CAGR: {net_income_cagr}). The profitability outlook relies on realizing revenue growth, managing cost inflation (COGS, operating expenses), and achieving assumed margin improvements. The projected {net_income_cagr} CAGR for Net Income relative to the {revenue_cagr} CAGR for Revenue suggests an assumption of margin expansion contributing to bottom-line growth.
+        """),
+    # Key Activities & Investments
+    ("<u>Projected Investments and Activities</u>", """
+        <b>Research & Development:</b> R&D spending is projected to increase from a baseline of {base_rnd} to {proj_rnd} (CAGR: {rnd_cagr}). This reflects a strategic priority to invest in innovation related to product efficacy, sustainability, and technology integration (e.g., AR/AI applications in beauty).
+        <br/><br/>
+        <b>Operational Focus:</b> Assumptions include ongoing efforts to optimize the supply chain, enhance digital capabilities for e-commerce and customer engagement, and manage operating expenses effectively to support margin improvement targets. Specific capital expenditure plans are not detailed in this simulation but are assumed to support growth initiatives.
+        """),
+    # Liquidity & Capital Resources Outlook
+    ("<u>Projected Liquidity and Capital Resources</u>", """
+        The projections assume sufficient liquidity will be generated from operations to fund planned investments. Existing capital structure and access to credit markets are assumed stable. Significant deviations in operating cash flow or unforeseen capital needs could impact this outlook. (Detailed cash flow statement projections are not included).
+        """),
+)
+
+# --- Styles ---
+@lru_cache(maxsize=1)
+def _build_styles() -> Tuple['StyleSheet1', 'TableStyle']:
+    """
+    Builds the report paragraph styles and the standard table style.
+
+    The styles are static, so they are built once per process and shared by
+    every ReportGenerator; treat both as read-only (clone a TableStyle with
+    `TableStyle(table_style.getCommands())` before adding commands).
+    """
+    from reportlab.lib import colors
+    from reportlab.platypus import TableStyle
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT, TA_JUSTIFY
+    styles = getSampleStyleSheet()
+    # --- Base Style ---
+    styles.add(ParagraphStyle(name='Body', parent=styles['Normal'], fontSize=9, leading=11, spaceAfter=5, alignment=TA_JUSTIFY))
+    # --- Titles ---
+    styles.add(ParagraphStyle(name='ReportTitle', parent=styles['h1'], alignment=TA_CENTER, fontSize=16, spaceAfter=5, textColor=colors.darkblue))
+    styles.add(ParagraphStyle(name='ReportSubTitle', parent=styles['h2'], alignment=TA_CENTER, fontSize=11, spaceAfter=10, textColor=colors.dimgray))
+    # --- 10-K Structure Titles ---
+    styles.add(ParagraphStyle(name='PartTitle', parent=styles['h2'], fontSize=11, spaceBefore=16, spaceAfter=5, alignment=TA_LEFT, fontName='Helvetica-Bold', textColor=colors.black))
+    styles.add(ParagraphStyle(name='ItemTitle', parent=styles['h3'], fontSize=10, spaceBefore=10, spaceAfter=3, alignment=TA_LEFT, fontName='Helvetica-Bold', textColor=colors.darkslategray))
+    styles.add(ParagraphStyle(name='SectionTitle', parent=styles['h4'], fontSize=9, spaceBefore=8, spaceAfter=2, alignment=TA_LEFT, fontName='Helvetica-Bold', textColor=colors.darkslategray))
+    # --- Tables ---
+    styles.add(ParagraphStyle(name='TableTitle', parent=styles['Italic'], alignment=TA_CENTER, fontSize=8, spaceBefore=5, spaceAfter=1))
+    styles.add(ParagraphStyle(name='TableHeader', parent=styles['Normal'], alignment=TA_CENTER, fontSize=8, fontName='Helvetica-Bold', textColor=colors.white)) # White text on dark header
+    styles.add(ParagraphStyle(name='TableCell', parent=styles['Normal'], alignment=TA_RIGHT, fontSize=8))
+    styles.add(ParagraphStyle(name='TableCellLeft', parent=styles['Normal'], alignment=TA_LEFT, fontSize=8))
+    styles.add(ParagraphStyle(name='TableCellCenter', parent=styles['Normal'], alignment=TA_CENTER, fontSize=8))
+    # --- Other ---
+    styles.add(ParagraphStyle(name='Footer', parent=styles['Normal'], alignment=TA_CENTER, fontSize=7, textColor=colors.grey))
+    styles.add(ParagraphStyle(name='Disclaimer', parent=styles['Italic'], fontSize=8, spaceBefore=5, spaceAfter=5, alignment=TA_LEFT, textColor=colors.darkred))
+    styles.add(ParagraphStyle(name='CustomBullet', parent=styles['Body'], firstLineIndent=0, leftIndent=18, bulletIndent=0, spaceAfter=2)) # Renamed from 'Bullet'
+    styles.add(ParagraphStyle(name='BulletBold', parent=styles['CustomBullet'], fontName='Helvetica-Bold')) # Updated parent style
+
+    # --- Table Styles ---
+    table_style_std = TableStyle([
+        # Grid and Borders
+        ('BOX', (0,0), (-1,-1), 1, colors.darkgrey),
+        ('TEXTCOLOR', (0,0), (-1,-1), colors.black), # Default text colour; the header overrides it below
+        # Header Row
+        ('BACKGROUND', (0,0), (-1,0), colors.darkslategray),
+        ('TEXTCOLOR', (0,0), (-1,0), colors.white),
+        ('ALIGN', (0,0), (-1,0), 'CENTER'),
+        ('VALIGN', (0,0), (-1,0), 'MIDDLE'),
+        ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0,0), (-1,0), 8),
+        # Data Rows
+        ('ALIGN', (1,1), (-1,-1), 'RIGHT'),
+        ('ALIGN', (0,1), (0,-1), 'LEFT'),
+        ('VALIGN', (0,1), (-1,-1), 'TOP'),
+        ('FONTNAME', (0,1), (-1,-1), 'Helvetica'),
+        ('FONTSIZE', (0,1), (-1,-1), 8),
+        ('GRID', (0,0), (-1,-1), 1, colors.black),
+        # Alternating data rows (odd white, even whitesmoke), for however many rows the table has
+        ('ROWBACKGROUNDS', (0,1), (-1,-1), [colors.white, colors.whitesmoke]),
+    ])
+
+    return styles, table_style_std
+
+def _fresh_copies(flowables: Tuple[Any, ...]) -> List[Any]:
+    """
+    Shallow copies of cached flowables for one document.
+
+    A build records layout state on the flowables it handles (e.g. `_postponed`
+    after a page break), which would make a later document reject them; the
+    copies keep the parsed paragraph text, so nothing is re-parsed.
+    """
+    return [copy.copy(flowable) for flowable in flowables]
+
+@lru_cache(maxsize=None)
+def _front_matter(timeframe: str) -> Tuple[Any, ...]:
+    """
+    Title page and disclaimer flowables for `timeframe`.
+
+    They depend only on the timeframe, so each process parses them once;
+    reports use `_fresh_copies` of them.
+    """
+    from reportlab.platypus import Paragraph, Spacer, PageBreak
+    from reportlab.lib.units import inch
+    styles = _build_styles()[0]
+    horizon = timeframe.replace('_',' ')
+    return (
+        # Title Page
+        Paragraph("FORM 10-K - FINANCIAL PROJECTION", styles['ReportTitle']),
+        Spacer(1, 0.1*inch),
+        Paragraph("Beauty First Cosmetics (BFC)", styles['ReportSubTitle']),
+        Spacer(1, 0.05*inch),
+        Paragraph(f"Projection Horizon: {horizon.title()}", styles['ReportSubTitle']),
+        Paragraph(f"(Based on 2018 Baseline - Internal Simulation v3)", styles['ReportSubTitle']),
+        PageBreak(),
+        # Disclaimer
+        Paragraph("Important Disclaimer & Basis of Preparation", styles['ItemTitle']),
+        Paragraph(_DISCLAIMER_TEMPLATE.format(horizon=horizon), styles['Disclaimer']),
+        Spacer(1, 0.2*inch),
+    )
+
+@lru_cache(maxsize=None)
+def _risk_factor_flowables(timeframe: str) -> Tuple[Any, ...]:
+    """'Item 1A. Risk Factors' flowables for `timeframe`; static apart from the long-term category."""
+    from reportlab.platypus import Paragraph, Spacer
+    from reportlab.lib.units import inch
+    styles = _build_styles()[0]
+    bullet_style, section_style = styles['CustomBullet'], styles['SectionTitle']
+    small_spacer = Spacer(1, 0.05*inch) # Fixed size, so one instance can appear several times in the story
+    story = []
+    story.extend([
+        Paragraph("Achieving the financial projections outlined in this document is subject to various significant risks and uncertainties. If these risks materialize, actual results could differ materially from projections. Key risk categories include:", styles['Body']),
+        small_spacer,
+    ])
+
+    # Using Paragraphs with embedded bold tags for subheadings
+    risk_categories = _RISK_CATEGORIES_BASE
+    # Add timeframe specific nuances if desired
+    if timeframe in ('five_year', 'ten_year'):
+        risk_categories += ((_LONG_TERM_RISKS_TITLE,
+                             tuple(risk.format(horizon=timeframe.replace('_',' ')) for risk in _LONG_TERM_RISKS)),)
+
+    for category_title, risks in risk_categories:
+        story.append(Paragraph(category_title, section_style)) # Use SectionTitle for category
+        story.extend(Paragraph(f"• {risk}", bullet_style) for risk in risks)
+        story.append(small_spacer)
+
+    return tuple(story)
+
+# Extra command for tables whose last (CAGR) column is centered in the body rows
+_CAGR_COLUMN_STYLE: Tuple[tuple, ...] = (('ALIGN', (3,1), (3,-1), 'CENTER'),)
+
+# How long close() waits for running renders before terminating the pool's workers
+_SHUTDOWN_TIMEOUT_SECONDS = 30
+
+def _render_context():
+    """fork where available, so render workers start with ReportLab already imported."""
+    return multiprocessing.get_context('fork' if 'fork' in multiprocessing.get_all_start_methods() else 'spawn')
+
+def _terminate_workers(executor: ProcessPoolExecutor) -> None:
+    """Terminates the pool's worker processes, e.g. ones stuck in a render."""
+    terminate_workers = getattr(executor, 'terminate_workers', None) # Public API from Python 3.14
+    if terminate_workers is not None:
+        terminate_workers()
+        return
+    # Older versions only expose the workers through this CPython-internal attribute; if it is
+    # ever missing, the workers are left to the pool's own shutdown
+    for process in list((getattr(executor, '_processes', None) or {}).values()):
+        process.terminate()
+
+@lru_cache(maxsize=None)
+def _worker_generator(output_dir: str) -> 'ReportGenerator':
+    """One ReportGenerator per output directory per render worker, reused across its tasks."""
+    return ReportGenerator(output_dir)
+
+def _render_in_worker(output_dir: str, timeframe_data: Dict[str, Any], timeframe: str,
+                      baseline_fmt: Dict[str, str]) -> str:
+    """Process-pool task: renders one timeframe report with the worker's own generator."""
+    return _worker_generator(output_dir)._generate_single_10k_report(timeframe_data, timeframe, baseline_fmt)
+
 # --- Refined Report Generator ---
 class ReportGenerator:
     """Handles generation of 10-K style projection reports with improved structure."""
@@ -72,75 +383,53 @@ class ReportGenerator:
     def __init__(self, output_dir: Optional[str] = None):
         self.output_dir = Path(output_dir or './outputs_v3') # Match main.py default
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.styles = self._init_styles()
-        self._lock = threading.Lock()
-        # Use only 3 workers max, one for each report
-        self._executor = ThreadPoolExecutor(max_workers=3)
-
-    def _init_styles(self) -> Dict[str, ParagraphStyle]:
-        """Initialize styles used in the reports."""
-        styles = getSampleStyleSheet()
-        # --- Base Style ---
-        styles.add(ParagraphStyle(name='Body', parent=styles['Normal'], fontSize=9, leading=11, spaceAfter=5, alignment=TA_JUSTIFY))
-        # --- Titles ---
-        styles.add(ParagraphStyle(name='ReportTitle', parent=styles['h1'], alignment=TA_CENTER, fontSize=16, spaceAfter=5, textColor=colors.darkblue))
-        styles.add(ParagraphStyle(name='ReportSubTitle', parent=styles['h2'], alignment=TA_CENTER, fontSize=11, spaceAfter=10, textColor=colors.dimgray))
-        # --- 10-K Structure Titles ---
-        styles.add(ParagraphStyle(name='PartTitle', parent=styles['h2'], fontSize=11, spaceBefore=16, spaceAfter=5, alignment=TA_LEFT, fontName='Helvetica-Bold', textColor=colors.black))
-        styles.add(ParagraphStyle(name='ItemTitle', parent=styles['h3'], fontSize=10, spaceBefore=10, spaceAfter=3, alignment=TA_LEFT, fontName='Helvetica-Bold', textColor=colors.darkslategray))
-        styles.add(ParagraphStyle(name='SectionTitle', parent=styles['h4'], fontSize=9, spaceBefore=8, spaceAfter=2, alignment=TA_LEFT, fontName='Helvetica-Bold', textColor=colors.darkslategray))
-        # --- Tables ---
-        styles.add(ParagraphStyle(name='TableTitle', parent=styles['Italic'], alignment=TA_CENTER, fontSize=8, spaceBefore=5, spaceAfter=1))
-        styles.add(ParagraphStyle(name='TableHeader', parent=styles['Normal'], alignment=TA_CENTER, fontSize=8, fontName='Helvetica-Bold', textColor=colors.white)) # White text on dark header
-        styles.add(ParagraphStyle(name='TableCell', parent=styles['Normal'], alignment=TA_RIGHT, fontSize=8))
-        styles.add(ParagraphStyle(name='TableCellLeft', parent=styles['Normal'], alignment=TA_LEFT, fontSize=8))
-        styles.add(ParagraphStyle(name='TableCellCenter', parent=styles['Normal'], alignment=TA_CENTER, fontSize=8))
-        # --- Other ---
-        styles.add(ParagraphStyle(name='Footer', parent=styles['Normal'], alignment=TA_CENTER, fontSize=7, textColor=colors.grey))
-        styles.add(ParagraphStyle(name='Disclaimer', parent=styles['Italic'], fontSize=8, spaceBefore=5, spaceAfter=5, alignment=TA_LEFT, textColor=colors.darkred))
-        styles.add(ParagraphStyle(name='CustomBullet', parent=styles['Body'], firstLineIndent=0, leftIndent=18, bulletIndent=0, spaceAfter=2)) # Renamed from 'Bullet'
-        styles.add(ParagraphStyle(name='BulletBold', parent=styles['CustomBullet'], fontName='Helvetica-Bold')) # Updated parent style
-
-        # --- Table Styles ---
-        self.table_style_std = TableStyle([
-            # Grid and Borders
-            ('GRID', (0,0), (-1,-1), 0.5, colors.lightgrey),
-            ('BOX', (0,0), (-1,-1), 1, colors.darkgrey),
-            # Header Row
-            ('BACKGROUND', (0,0), (-1,0), colors.darkslategray),
-            ('TEXTCOLOR', (0,0), (-1,0), colors.white),
-            ('ALIGN', (0,0), (-1,0), 'CENTER'),
-            ('VALIGN', (0,0), (-1,0), 'MIDDLE'),
-            ('FONTNAME', (0,0), (-1,0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0,0), (-1,0), 8),
-            # Data Rows
-            ('ALIGN', (1,1), (-1,-1), 'RIGHT'),
-            ('ALIGN', (0,1), (0,-1), 'LEFT'),
-            ('VALIGN', (0,1), (-1,-1), 'TOP'),
-            ('FONTNAME', (0,1), (-1,-1), 'Helvetica'),
-            ('FONTSIZE', (0,1), (-1,-1), 8),
-            ('BACKGROUND', (0,1), (-1,-1), colors.white),
-            ('TEXTCOLOR', (0,0), (-1,-1), colors.black),
-            ('GRID', (0,0), (-1,-1), 1, colors.black),
-        ])
-        # Add alternating row colors helper
-        for i in range(1, 20): # Apply to first 20 rows
-             if i % 2 == 0:
-                  bg_color = colors.whitesmoke
-             else:
-                  bg_color = colors.white
-             self.table_style_std.add('BACKGROUND', (0, i), (-1, i), bg_color)
-
+        self.styles, self.table_style_std = _build_styles() # Shared, read-only
+        # Created on first use and kept across generate_10k_reports calls; shut down by close()/__exit__
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._futures: List[Future] = [] # Submitted renders not yet seen finished, for close()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Returns the render pool, (re)creating it after close()."""
+        if self._executor is None:
+            # PDF layout is pure-Python and holds the GIL, so each report renders in its own process.
+            # Use only 3 workers max, one for each report
+            self._executor = ProcessPoolExecutor(max_workers=3, mp_context=_render_context())
+        return self._executor
+
+    def close(self, graceful: bool = True) -> None:
+        """
+        Shuts down the render pool; the generator stays usable.
 
-        return styles
+        A graceful close waits for every submitted report. Otherwise (abort
+        paths) reports that have not started yet are cancelled and only the
+        running ones are waited for. Either way the wait is bounded by
+        _SHUTDOWN_TIMEOUT_SECONDS; workers still busy after that are
+        terminated so a stuck render cannot hang process exit.
+        """
+        if self._executor is not None:
+            if not graceful:
+                cancelled = sum(future.cancel() for future in self._futures)
+                if cancelled:
+                    logger.warning(f"Cancelled {cancelled} pending report render(s) during shutdown.")
+            _, not_done = wait([f for f in self._futures if not f.done()], timeout=_SHUTDOWN_TIMEOUT_SECONDS)
+            if not_done:
+                logger.warning(f"{len(not_done)} report render(s) still running after {_SHUTDOWN_TIMEOUT_SECONDS}s; "
+                               f"terminating render workers.")
+                for future in not_done:
+                    future.cancel()
+                # Interpreter exit joins the pool, so stuck workers must be stopped rather than abandoned
+                _terminate_workers(self._executor)
+            # Only wait on the pool when nothing is stuck; cancel_futures drops anything still queued
+            self._executor.shutdown(wait=not not_done, cancel_futures=True)
+            self._executor = None
+        self._futures = []
 
     # --- Header/Footer Logic ---
-    _current_header_text = "BFC Projection Report"
-    _current_timeframe_header = ""
-
-    def _header(self, canvas, doc):
+    def _header(self, canvas, doc, header_text: str, timeframe: str):
+         # header_text/timeframe are bound per document in _create_page_template, so parallel builds never share them
+         from reportlab.platypus import Paragraph
          canvas.saveState()
-         header = Paragraph(f"{self._current_header_text} - {self._current_timeframe_header}", self.styles['Normal'])
+         header = Paragraph(f"{header_text} - {timeframe}", self.styles['Normal'])
          w, h = header.wrap(doc.width, doc.topMargin)
          header.drawOn(canvas, doc.leftMargin, doc.height + doc.topMargin - h + 10)
          canvas.setStrokeColorRGB(0.7, 0.7, 0.7) # Lighter grey line
@@ -148,6 +437,7 @@ class ReportGenerator:
          canvas.restoreState()
 
     def _footer(self, canvas, doc):
+         from reportlab.platypus import Paragraph
          canvas.saveState()
          footer = Paragraph(f"Page {doc.page} | BFC 10-K Projections (Internal Simulation - Not for Filing)", self.styles['Footer'])
          w, h = footer.wrap(doc.width, doc.bottomMargin)
@@ -155,13 +445,13 @@ class ReportGenerator:
          canvas.restoreState()
 
     def _create_page_template(self, doc, header_text="BFC Projection Report", timeframe=""):
-         self._current_header_text = header_text
-         self._current_timeframe_header = timeframe
          # Increased frame padding for more white space
+         from reportlab.platypus import Frame, PageTemplate
          frame = Frame(doc.leftMargin, doc.bottomMargin, doc.width, doc.height, id='normal',
                        leftPadding=10, bottomPadding=10, rightPadding=10, topPadding=10)
          template = PageTemplate(id='main', frames=frame,
-                                 onPage=self._header, onPageEnd=self._footer)
+                                 onPage=partial(self._header, header_text=header_text, timeframe=timeframe),
+                                 onPageEnd=self._footer)
          return template
 
     # --- Main Report Generation Method ---
@@ -169,40 +459,66 @@ class ReportGenerator:
         """Generates 1, 5, and 10-year 10-K style projection reports in parallel."""
         # (Same parallel execution logic as previous version)
         report_paths = {}
-        tasks = {
-            timeframe: (projection_data, timeframe)
-            for timeframe in ['one_year', 'five_year', 'ten_year']
-            if timeframe in projection_data
-        }
-        if 'baseline' not in projection_data or not tasks:
+        timeframes = [tf for tf in ['one_year', 'five_year', 'ten_year'] if tf in projection_data]
+        if 'baseline' not in projection_data or not timeframes:
              logger.error("Invalid projection_data provided to generate_10k_reports.")
              return {}
+        # Each worker only receives 'baseline' plus its own timeframe, as plain (picklable) dicts
+        baseline = dict(projection_data['baseline'])
+        tasks = {
+            timeframe: ({'baseline': baseline, timeframe: dict(projection_data[timeframe] or {})}, timeframe)
+            for timeframe in timeframes
+        }
 
-        with self._executor as executor:
-            future_to_timeframe = {
-                executor.submit(self._generate_single_10k_report, *args): timeframe
-                for timeframe, args in tasks.items()
-            }
-            for future in future_to_timeframe:
-                timeframe = future_to_timeframe[future]
-                try:
-                    report_paths[timeframe] = future.result()
-                except Exception as e:
-                    logger.error(f"Report generation failed for timeframe '{timeframe}': {e}", exc_info=True)
-                    report_paths[timeframe] = f"FAILED: {type(e).__name__}"
+        # Baseline cells read the same in every report, so format them once for all timeframes
+        baseline_fmt = format_baseline(baseline)
 
+        # The pool outlives this call; a `with` block here would shut it down after the first report set
+        executor = self._get_executor()
+        future_to_timeframe = {
+            executor.submit(_render_in_worker, str(self.output_dir), *args, baseline_fmt): timeframe
+            for timeframe, args in tasks.items()
+        }
+        self._futures = [f for f in self._futures if not f.done()] + list(future_to_timeframe)
+        for future in as_completed(future_to_timeframe): # Handle each report as soon as it finishes
+            timeframe = future_to_timeframe[future]
+            try:
+                report_paths[timeframe] = future.result()
+            except Exception as e:
+                logger.error(f"Report generation failed for timeframe '{timeframe}': {e}", exc_info=True)
+                report_paths[timeframe] = f"FAILED: {type(e).__name__}"
+
+        report_paths = {tf: report_paths[tf] for tf in tasks} # Back to timeframe order
         successful_reports = {k: v for k, v in report_paths.items() if not v.startswith("FAILED:")}
         failed_reports = {k: v for k, v in report_paths.items() if v.startswith("FAILED:")}
         if failed_reports:
              logger.error(f"Some 10-K reports failed: {failed_reports}")
         return successful_reports
 
+    def render_one(self, timeframe: str, timeframe_data: Dict[str, Any]) -> str:
+        """
+        Renders the report for a single timeframe and returns the PDF path.
+
+        `timeframe_data` only needs 'baseline' plus the entry for `timeframe`, so
+        process-based callers can ship a small, picklable slice of projection_data.
+        """
+        return self._generate_single_10k_report(timeframe_data, timeframe)
+
     # --- Single Report PDF Builder ---
-    def _generate_single_10k_report(self, projection_data: Dict[str, Any], timeframe: str) -> str:
-        """Generates the PDF content for a single 10-K report timeframe."""
+    def _generate_single_10k_report(self, projection_data: Dict[str, Any], timeframe: str,
+                                    baseline_fmt: Optional[Dict[str, str]] = None) -> str:
+        """
+        Generates the PDF content for a single 10-K report timeframe.
+
+        `baseline_fmt` is the output of `format_baseline`; it is computed here when not supplied.
+        """
+        from reportlab.lib.pagesizes import letter
+        from reportlab.platypus import BaseDocTemplate
+        from reportlab.lib.units import inch
         output_path = self.output_dir / f"BFC_10K_{timeframe}_Projection_v3.pdf" # Added version
         styles = self.styles
-        baseline = projection_data.get('baseline', {})
+        if baseline_fmt is None:
+            baseline_fmt = format_baseline(projection_data.get('baseline', {}))
         projections = projection_data.get(timeframe, {})
         years = {'one_year': 1, 'five_year': 5, 'ten_year': 10}.get(timeframe, 0)
         year_end_approx = 2018 + years
@@ -211,8 +527,20 @@ class ReportGenerator:
         if not projections:
              raise ReportGenerationError(f"No projection data found for timeframe '{timeframe}'.")
 
+        # Skip the build when the existing PDF is the one rendered from identical inputs and renderer code
+        content_hash = _content_hash(projection_data, timeframe)
+        if _is_up_to_date(output_path, content_hash):
+            logger.info(f"{timeframe} report is up to date, skipping build: {output_path}")
+            return str(output_path)
+
+        derived = derive_missing_cagrs(projection_data.get('baseline', {}), projections, years)
+        if derived:
+            projections = {**projections, **derived}
+
         try:
-            doc = BaseDocTemplate(str(output_path), pagesize=letter,
+            # Build into memory and write the file once; a failed build leaves no partial PDF behind
+            buffer = io.BytesIO()
+            doc = BaseDocTemplate(buffer, pagesize=letter,
                                   leftMargin=0.75*inch, rightMargin=0.75*inch,
                                   topMargin=1.0*inch, bottomMargin=1.0*inch)
             page_template = self._create_page_template(doc, timeframe=f"{timeframe_title} Projection (~{year_end_approx})")
@@ -220,11 +548,13 @@ class ReportGenerator:
 
             story = []
             # Build report sections
-            story.extend(self._build_report_sections(baseline, projections, timeframe))
+            story.extend(self._build_report_sections(baseline_fmt, projections, timeframe))
 
             logger.debug(f"Building PDF document for {timeframe}...")
-            with self._lock:
-                 doc.build(story)
+            doc.build(story) # Each call owns its doc, story and output file, so builds run in parallel
+            pdf_bytes = buffer.getvalue()
+            output_path.write_bytes(pdf_bytes)
+            _write_build_record(output_path, content_hash, pdf_bytes)
 
             logger.info(f"Successfully built and saved {timeframe} report PDF to {output_path}")
             return str(output_path)
@@ -238,103 +568,105 @@ class ReportGenerator:
             # Wrap general exceptions
             raise ReportRenderingError(f"Failed building {timeframe} PDF: {str(e)}") from e
 
-    def _build_report_sections(self, baseline: Dict, projections: Dict, timeframe: str) -> List:
+    def _build_report_sections(self, baseline_fmt: Dict[str, str], projections: Dict, timeframe: str) -> List:
         """Builds all sections of the report in order."""
+        from reportlab.platypus import Paragraph, Spacer, PageBreak, KeepTogether
+        from reportlab.lib.units import inch
+        styles = self.styles
         story = []
-        
-        # Title Page
-        story.append(Paragraph("FORM 10-K - FINANCIAL PROJECTION", self.styles['ReportTitle']))
-        story.append(Spacer(1, 0.1*inch))
-        story.append(Paragraph("Beauty First Cosmetics (BFC)", self.styles['ReportSubTitle']))
-        story.append(Spacer(1, 0.05*inch))
-        story.append(Paragraph(f"Projection Horizon: {timeframe.replace('_',' ').title()}", self.styles['ReportSubTitle']))
-        story.append(Paragraph(f"(Based on 2018 Baseline - Internal Simulation v3)", self.styles['ReportSubTitle']))
-        story.append(PageBreak())
 
-        # Disclaimer
-        story.append(Paragraph("Important Disclaimer & Basis of Preparation", self.styles['ItemTitle']))
-        disclaimer = f"""
-        <b>Disclaimer:</b> This document contains forward-looking statements and financial projections based on internal assumptions and methodologies. It is intended for illustrative and planning purposes only and does not constitute a formal SEC filing or audited financial statement. Actual results may differ materially due to various risks and uncertainties. This document should not be relied upon for investment decisions.
-        <br/><br/>
-        <b>Basis of Preparation:</b> Projections are derived from the company's 2018 baseline financial data and apply management's growth assumptions for revenue, EBITDA margin improvement, and R&D investment increases specific to the {timeframe.replace('_',' ')} horizon. Net income is projected based on simplified margin assumptions linked to EBITDA margin changes. Calculations do not constitute a full financial model. Key assumptions are detailed within relevant sections.
-        """
-        story.append(Paragraph(disclaimer, self.styles['Disclaimer']))
-        story.append(Spacer(1, 0.2*inch))
+        # Title page and disclaimer (shared, static per timeframe)
+        story.extend(_fresh_copies(_front_matter(timeframe)))
 
         # Part I
-        story.append(Paragraph("PART I", self.styles['PartTitle']))
-        story.append(Spacer(1, 0.05*inch))
-        story.append(Paragraph("Item 1. Business", self.styles['ItemTitle']))
-        story.extend(self._build_business_section(baseline, projections, timeframe))
-        story.append(Spacer(1, 0.1*inch))
-        story.append(Paragraph("Item 1A. Risk Factors", self.styles['ItemTitle']))
+        story.extend([
+            Paragraph("PART I", styles['PartTitle']),
+            Spacer(1, 0.05*inch),
+            Paragraph("Item 1. Business", styles['ItemTitle']),
+        ])
+        story.extend(self._build_business_section(baseline_fmt, projections, timeframe))
+        story.extend([
+            Spacer(1, 0.1*inch),
+            Paragraph("Item 1A. Risk Factors", styles['ItemTitle']),
+        ])
         story.extend(self._build_risk_factors_section(timeframe))
         story.append(PageBreak())
 
         # Part II
-        story.append(Paragraph("PART II", self.styles['PartTitle']))
-        story.append(Spacer(1, 0.05*inch))
-        story.append(Paragraph("Item 6. Selected Financial Data (Projected)", self.styles['ItemTitle']))
-        story.append(KeepTogether(self._build_selected_financial_table(baseline, projections, timeframe)))
-        story.append(Spacer(1, 0.1*inch))
-
-        story.append(Paragraph("Item 7. Management's Discussion and Analysis (Projected)", self.styles['ItemTitle']))
-        story.extend(self._build_mdna_section(baseline, projections, timeframe))
+        story.extend([
+            Paragraph("PART II", styles['PartTitle']),
+            Spacer(1, 0.05*inch),
+            Paragraph("Item 6. Selected Financial Data (Projected)", styles['ItemTitle']),
+            KeepTogether(self._build_selected_financial_table(baseline_fmt, projections, timeframe)),
+            Spacer(1, 0.1*inch),
+            Paragraph("Item 7. Management's Discussion and Analysis (Projected)", styles['ItemTitle']),
+        ])
+        story.extend(self._build_mdna_section(baseline_fmt, projections, timeframe))
         story.append(Spacer(1, 0.1*inch))
 
         return story
 
     # --- Section Building Methods (Returning Lists of Flowables) ---
 
-    def _build_business_section(self, baseline: Dict, projections: Dict, timeframe: str) -> List:
+    def _build_business_section(self, baseline_fmt: Dict[str, str], projections: Dict, timeframe: str) -> List:
         """Builds the 'Item 1. Business' content."""
+        from reportlab.platypus import Paragraph, Spacer, Table, KeepTogether
+        from reportlab.lib.units import inch
         styles = self.styles
         story = []
-        story.append(Paragraph("<u>Company Overview & Projected Strategy</u>", styles['SectionTitle']))
         overview_text = f"""
         Beauty First Cosmetics (BFC) is a significant participant in the global cosmetics sector, offering products across skincare, makeup, fragrance, and hair care. This document outlines projections for the {timeframe.replace('_', ' ')} timeframe, using the 2018 fiscal year as a baseline. The underlying strategy assumes continued focus on core brand equities, investment in product innovation (particularly in high-growth categories and sustainable offerings), expansion of digital capabilities (e-commerce, AR tools), and targeted geographic market development. Operational efficiency improvements are also factored into margin projections.
         """
-        story.append(Paragraph(overview_text, styles['Body']))
-        story.append(Spacer(1, 0.1*inch))
+        story.extend([
+            Paragraph("<u>Company Overview & Projected Strategy</u>", styles['SectionTitle']),
+            Paragraph(overview_text, styles['Body']),
+            Spacer(1, 0.1*inch),
+        ])
 
         # Key Assumptions Table
-        story.append(Paragraph("<u>Key Financial Projections & Assumptions</u>", styles['SectionTitle']))
-        # Use the refined table style (self.table_style_std)
-        # Ensure data passed to Paragraph is string
+        # Header cells stay Paragraphs for the white bold header font; body cells are plain strings
+        # styled by the table itself, which avoids a Paragraph wrap/layout per cell.
         highlights_data = [
              [Paragraph(h, styles['TableHeader']) for h in ['Metric', 'Baseline (2018)', f'Projected ({timeframe.replace("_"," ").title()})', 'Implied CAGR (%)']],
-             [Paragraph('Revenue', styles['TableCellLeft']),
-              Paragraph(format_currency(safe_get(baseline, 'revenue')), styles['TableCell']),
-              Paragraph(format_currency(safe_get(projections, 'projected_revenue')), styles['TableCell']),
-              Paragraph(format_percent(safe_get(projections, 'revenue_cagr')), styles['TableCellCenter'])],
-             [Paragraph('EBITDA', styles['TableCellLeft']),
-              Paragraph(format_currency(safe_get(baseline, 'ebitda')), styles['TableCell']),
-              Paragraph(format_currency(safe_get(projections, 'projected_ebitda')), styles['TableCell']),
-              Paragraph(format_percent(safe_get(projections, 'ebitda_cagr')), styles['TableCellCenter'])],
-             [Paragraph('EBITDA Margin', styles['TableCellLeft']),
-              Paragraph(format_percent_from_decimal(safe_get(baseline, 'ebitda_margin',0)), styles['TableCell']),
-              Paragraph(format_percent_from_decimal(safe_get(projections, 'projected_ebitda_margin',0)), styles['TableCell']),
-              Paragraph(" ", styles['TableCellCenter'])],
-             [Paragraph('Net Income', styles['TableCellLeft']), # Added Net Income
-              Paragraph(format_currency(safe_get(baseline, 'net_income')), styles['TableCell']),
-              Paragraph(format_currency(safe_get(projections, 'projected_net_income')), styles['TableCell']),
-              Paragraph(format_percent(safe_get(projections, 'net_income_cagr')), styles['TableCellCenter'])],
-             [Paragraph('R&D Spend', styles['TableCellLeft']),
-              Paragraph(format_currency(safe_get(baseline, 'r_and_d_spend')), styles['TableCell']),
-              Paragraph(format_currency(safe_get(projections, 'projected_r_and_d_spend')), styles['TableCell']),
-              Paragraph(format_percent(safe_get(projections, 'rnd_cagr')), styles['TableCellCenter'])],
+             ['Revenue',
+              baseline_fmt['revenue'],
+              format_currency(projections.get('projected_revenue')),
+              format_percent(projections.get('revenue_cagr'))],
+             ['EBITDA',
+              baseline_fmt['ebitda'],
+              format_currency(projections.get('projected_ebitda')),
+              format_percent(projections.get('ebitda_cagr'))],
+             ['EBITDA Margin',
+              baseline_fmt['ebitda_margin'],
+              format_percent_from_decimal(projections.get('projected_ebitda_margin',0)),
+              ''],
+             ['Net Income', # Added Net Income
+              baseline_fmt['net_income'],
+              format_currency(projections.get('projected_net_income')),
+              format_percent(projections.get('net_income_cagr'))],
+             ['R&D Spend',
+              baseline_fmt['r_and_d_spend'],
+              format_currency(projections.get('projected_r_and_d_spend')),
+              format_percent(projections.get('rnd_cagr'))],
         ]
         highlights_table = Table(highlights_data, colWidths=[1.8*inch, 1.6*inch, 1.6*inch, 1.5*inch])
         highlights_table.setStyle(self.table_style_std) # Apply the refined style
-        story.append(KeepTogether(highlights_table)) # Wrap in KeepTogether
+        highlights_table.setStyle(_CAGR_COLUMN_STYLE) # CAGR column is centered
+        story.extend([
+            Paragraph("<u>Key Financial Projections & Assumptions</u>", styles['SectionTitle']),
+            KeepTogether(highlights_table), # Wrap in KeepTogether
+        ])
         return story
 
 
-    def _build_selected_financial_table(self, baseline: Dict, projections: Dict, timeframe: str) -> Table:
+    def _build_selected_financial_table(self, baseline_fmt: Dict[str, str], projections: Dict, timeframe: str) -> 'Table':
+        from reportlab.lib import colors
+        from reportlab.platypus import Paragraph, Table, TableStyle
+        from reportlab.lib.units import inch
         styles = self.styles
         years = {'one_year': 1, 'five_year': 5, 'ten_year': 10}.get(timeframe, 0)
         
-        # Create data with Paragraph objects for each cell
+        # Header cells are Paragraphs; body cells are plain strings aligned by the table style
         data = [
             [Paragraph(cell, styles['TableHeader']) for cell in 
              ['Metric', 'Baseline (2018)', f'Projected (~{2018+years})', f'CAGR ({years}yr)']],
@@ -346,13 +678,12 @@ class ReportGenerator:
             ('EBITDA', 'ebitda', 'projected_ebitda', 'ebitda_cagr'),
             ('Net Income', 'net_income', 'projected_net_income', 'net_income_cagr')
         ]:
-            row = [
-                Paragraph(metric, styles['TableCellLeft']),
-                Paragraph(format_currency(safe_get(baseline, base_key)), styles['TableCell']),
-                Paragraph(format_currency(safe_get(projections, proj_key)), styles['TableCell']),
-                Paragraph(format_percent(safe_get(projections, cagr_key)), styles['TableCellCenter'])
-            ]
-            data.append(row)
+            data.append([
+                metric,
+                baseline_fmt[base_key],
+                format_currency(projections.get(proj_key)),
+                format_percent(projections.get(cagr_key)),
+            ])
 
         # Create table with fixed column widths
         table = Table(data, colWidths=[2.0*inch, 1.5*inch, 1.5*inch, 1.5*inch])
@@ -368,128 +699,66 @@ class ReportGenerator:
             ('TOPPADDING', (0,0), (-1,-1), 3),
             ('BOTTOMPADDING', (0,0), (-1,-1), 3),
             ('BACKGROUND', (0,1), (-1,-1), colors.white),
+            ('FONTNAME', (0,1), (-1,-1), 'Helvetica'),
+            ('ALIGN', (0,1), (0,-1), 'LEFT'),
+            ('ALIGN', (1,1), (2,-1), 'RIGHT'),
+            ('ALIGN', (3,1), (3,-1), 'CENTER'),
         ])
         table.setStyle(style)
         return table
 
 
-    def _build_mdna_section(self, baseline: Dict, projections: Dict, timeframe: str) -> List:
+    def _build_mdna_section(self, baseline_fmt: Dict[str, str], projections: Dict, timeframe: str) -> List:
         """Builds the 'Item 7. MD&A' projection content (list of flowables)."""
+        from reportlab.platypus import Paragraph, Spacer
+        from reportlab.lib.units import inch
         styles = self.styles
         story = []
-        # Extract key values using helpers for formatting
-        proj_rev = format_currency(safe_get(projections, 'projected_revenue'))
-        revenue_cagr = format_percent(safe_get(projections, 'revenue_cagr'))
-        proj_ebitda = format_currency(safe_get(projections, 'projected_ebitda'))
-        proj_ebitda_margin = format_percent_from_decimal(safe_get(projections, 'projected_ebitda_margin', 0))
-        ebitda_cagr = format_percent(safe_get(projections, 'ebitda_cagr'))
-        proj_net_income = format_currency(safe_get(projections, 'projected_net_income'))
-        net_income_cagr = format_percent(safe_get(projections, 'net_income_cagr'))
-        proj_rnd = format_currency(safe_get(projections, 'projected_r_and_d_spend'))
-        base_rnd = format_currency(safe_get(baseline, 'r_and_d_spend'))
-        rnd_cagr = format_percent(safe_get(projections, 'rnd_cagr'))
-
-        # --- Introduction ---
-        story.append(Paragraph("<u>Introduction and Basis of Projection</u>", styles['SectionTitle']))
-        intro_text = f"""
-        This MD&A discusses projected financial trends for BFC over the {timeframe.replace('_', ' ')} horizon, based on 2018 baseline data and specified growth assumptions. These projections are illustrative, forward-looking, and subject to risks. They do not represent formal guidance or audited forecasts. Key assumptions involve revenue growth (driven by market factors and strategic initiatives), targeted improvements in EBITDA margin through operational leverage and efficiency, and increased R&D investment to foster innovation.
-        """
-        story.append(Paragraph(intro_text, styles['Body']))
-        story.append(Spacer(1, 0.1*inch))
-
-        # --- Projected Results with CAGR Commentary ---
-        story.append(Paragraph("<u>Projected Financial Performance</u>", styles['SectionTitle']))
-        results_text = f"""
-        <b>Revenue:</b> Projected to reach {proj_rev}, representing an implied CAGR of {revenue_cagr}. Achieving this growth depends on factors like successful product launches, effective marketing, digital channel performance, and overall market conditions.
-        <br/><br/>
-        <b>Profitability:</b> EBITDA is projected at {proj_ebitda} with an anticipated margin of {proj_ebitda_margin}. The implied EBITDA CAGR is {ebitda_cagr}. Net Income is projected at {proj_net_income} (CAGR: {net_income_cagr}). The profitability outlook relies on realizing revenue growth, managing cost inflation (COGS, operating expenses), and achieving assumed margin improvements. The projected {net_income_cagr} CAGR for Net Income relative to the {revenue_cagr} CAGR for Revenue suggests an assumption of margin expansion contributing to bottom-line growth.
-        """
-        story.append(Paragraph(results_text, styles['Body']))
-        story.append(Spacer(1, 0.1*inch))
-
-        # --- Key Activities & Investments ---
-        story.append(Paragraph("<u>Projected Investments and Activities</u>", styles['SectionTitle']))
-        investment_text = f"""
-        <b>Research & Development:</b> R&D spending is projected to increase from a baseline of {base_rnd} to {proj_rnd} (CAGR: {rnd_cagr}). This reflects a strategic priority to invest in innovation related to product efficacy, sustainability, and technology integration (e.g., AR/AI applications in beauty).
-        <br/><br/>
-        <b>Operational Focus:</b> Assumptions include ongoing efforts to optimize the supply chain, enhance digital capabilities for e-commerce and customer engagement, and manage operating expenses effectively to support margin improvement targets. Specific capital expenditure plans are not detailed in this simulation but are assumed to support growth initiatives.
-        """
-        story.append(Paragraph(investment_text, styles['Body']))
-        story.append(Spacer(1, 0.1*inch))
-
-        # --- Liquidity & Capital Resources Outlook ---
-        story.append(Paragraph("<u>Projected Liquidity and Capital Resources</u>", styles['SectionTitle']))
-        liquidity_text = """
-        The projections assume sufficient liquidity will be generated from operations to fund planned investments. Existing capital structure and access to credit markets are assumed stable. Significant deviations in operating cash flow or unforeseen capital needs could impact this outlook. (Detailed cash flow statement projections are not included).
-        """
-        story.append(Paragraph(liquidity_text, styles['Body']))
+        # Formatted values for the _MDNA_SECTIONS templates
+        values = {
+            'horizon': timeframe.replace('_', ' '),
+            'proj_rev': format_currency(projections.get('projected_revenue')),
+            'revenue_cagr': format_percent(projections.get('revenue_cagr')),
+            'proj_ebitda': format_currency(projections.get('projected_ebitda')),
+            'proj_ebitda_margin': format_percent_from_decimal(projections.get('projected_ebitda_margin', 0)),
+            'ebitda_cagr': format_percent(projections.get('ebitda_cagr')),
+            'proj_net_income': format_currency(projections.get('projected_net_income')),
+            'net_income_cagr': format_percent(projections.get('net_income_cagr')),
+            'proj_rnd': format_currency(projections.get('projected_r_and_d_spend')),
+            'base_rnd': baseline_fmt['r_and_d_spend'],
+            'rnd_cagr': format_percent(projections.get('rnd_cagr')),
+        }
+        for i, (title, template) in enumerate(_MDNA_SECTIONS):
+            if i: # Spacer between sub-sections, none after the last
+                story.append(Spacer(1, 0.1*inch))
+            story.extend([
+                Paragraph(title, styles['SectionTitle']),
+                Paragraph(template.format_map(values), styles['Body']),
+            ])
 
         return story
 
 
     def _build_risk_factors_section(self, timeframe: str) -> List:
         """Builds the 'Item 1A. Risk Factors' content (list of flowables)."""
-        styles = self.styles
-        story = []
-        story.append(Paragraph("Achieving the financial projections outlined in this document is subject to various significant risks and uncertainties. If these risks materialize, actual results could differ materially from projections. Key risk categories include:", styles['Body']))
-        story.append(Spacer(1, 0.05*inch))
-
-        # Using Paragraphs with embedded bold tags for subheadings
-        risk_categories = {
-            "<b>Market & Competition Risks:</b>": [
-                "Shifts in consumer preferences, beauty trends, or spending power.",
-                "Intensified competition from established global players and emerging/niche brands, potentially leading to price pressures or market share erosion.",
-                "Failure to adapt to evolving retail channels (e.g., D2C, social commerce, traditional retail dynamics)."
-            ],
-            "<b>Operational & Supply Chain Risks:</b>": [
-                "Disruptions in sourcing key raw materials or packaging components.",
-                "Manufacturing capacity constraints or quality control issues.",
-                "Logistics and transportation challenges impacting cost and delivery.",
-                "Cybersecurity incidents affecting operations, customer data, or intellectual property."
-            ],
-            "<b>Macroeconomic & Geopolitical Risks:</b>": [
-                "Global or regional economic downturns impacting consumer demand.",
-                "Persistent inflation affecting input costs and consumer prices.",
-                "Significant adverse fluctuations in foreign currency exchange rates.",
-                "Changes in international trade regulations, tariffs, or geopolitical instability in key markets."
-            ],
-            "<b>Strategic & Execution Risks:</b>": [
-                "Inability to successfully develop and launch innovative, commercially viable products.",
-                "Ineffective marketing campaigns or damage to brand reputation.",
-                "Challenges in implementing digital transformation initiatives or integrating new technologies.",
-                "Difficulties in attracting and retaining key talent."
-             ],
-             "<b>Regulatory & Compliance Risks:</b>": [
-                "Changes in regulations regarding cosmetic ingredients, safety testing, advertising standards, or environmental compliance.",
-                "Increased scrutiny or regulations related to data privacy and protection."
-             ]
-        }
-        # Add timeframe specific nuances if desired
-        if timeframe in ['five_year', 'ten_year']:
-            risk_categories["<b>Longer-Term & Emerging Risks:</b>"] = [
-                "Fundamental shifts in technology impacting product development or customer interaction.",
-                "Significant demographic changes affecting target consumer groups.",
-                f"Challenges in meeting ambitious long-term ({timeframe.replace('_',' ')}) sustainability goals.",
-                "Impact of climate change on supply chains or consumer behavior."
-            ]
-
-        for category_title, risks in risk_categories.items():
-             story.append(Paragraph(category_title, styles['SectionTitle'])) # Use SectionTitle for category
-             for risk in risks:
-                  story.append(Paragraph(f"• {risk}", styles['CustomBullet']))
-             story.append(Spacer(1, 0.05*inch))
+        return _fresh_copies(_risk_factor_flowables(timeframe))
 
-        return story
 
+    # --- Pickling Support (process pools) ---
+    def __getstate__(self):
+        # Executor and ReportLab styles are not picklable; rebuild them in the worker
+        return {'output_dir': str(self.output_dir)}
+
+    def __setstate__(self, state):
+        self.__init__(state['output_dir'])
 
     # --- Context Manager Methods ---
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self._executor:
-             # Ensure shutdown happens cleanly
-             try:
-                  self._executor.shutdown(wait=True, cancel_futures=False) # Allow completing futures
-             except Exception as e:
-                  logger.error(f"Error shutting down thread pool executor: {e}")
\ No newline at end of file
+        # Ensure shutdown happens cleanly; when leaving on an exception, don't start queued reports
+        try:
+             self.close(graceful=exc_type is None)
+        except Exception as e:
+             logger.error(f"Error shutting down render process pool: {e}")
\ No newline at end of file
@@ -2,21 +2,27 @@
 Provides baseline financial data and company description from the 2018 10-K.
 """
 
-from src.core.config import BASELINE_DATA
+from functools import cache
+from typing import Final
 
-def get_baseline_data():
+from src.core.config import BASELINE, Baseline
+
+_OVERVIEW: Final[str] = (
+    "Beauty First Cosmetics (BFC) is a leading U.S.-based cosmetics company with operations across multiple segments "
+    "including Cosmetics, Hair, Fragrances, Skin Care, and Beauty Tools. With a 7% market share in a $52B industry, "
+    "BFC employs approximately 11,000 people and maintains strong operational and financial fundamentals."
+)
+
+@cache
+def get_baseline_data() -> Baseline:
     """
-    Returns the baseline financial data for BFC.
+    Returns the baseline financial data for BFC as a read-only Baseline record.
     """
-    return BASELINE_DATA
+    return BASELINE
 
+@cache
 def get_company_overview():
     """
     Returns a brief company description based on the 2018 10-K.
     """
-    overview = (
-        "Beauty First Cosmetics (BFC) is a leading U.S.-based cosmetics company with operations across multiple segments "
-        "including Cosmetics, Hair, Fragrances, Skin Care, and Beauty Tools. With a 7% market share in a $52B industry, "
-        "BFC employs approximately 11,000 people and maintains strong operational and financial fundamentals."
-    )
-    return overview
+    return _OVERVIEW
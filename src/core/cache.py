@@ -0,0 +1,62 @@
+"""
+Simple on-disk JSON cache for projection results and generated report paths.
+"""
+
+import os
+import json
+import time
+import logging
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+def _json_default(value: Any) -> Any:
+    """Serializes the read-only mapping views used in projection results as plain objects."""
+    if isinstance(value, MappingProxyType):
+        return dict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+class FileCache:
+    """Stores JSON-serializable values as one `<key>.json` file per key under `cache_dir`."""
+
+    def __init__(self, cache_dir: str = '.cache', ttl_seconds: Optional[float] = None):
+        self.cache_dir = Path(cache_dir)
+        self.ttl_seconds = ttl_seconds # None = entries never expire
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Returns the cached value for `key`, or None if missing, expired or unreadable."""
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache entry '{path}': {e}")
+            return None
+
+        expires_at = entry.get('expires_at')
+        if expires_at is not None and time.time() > expires_at:
+            logger.debug(f"Cache entry '{key}' has expired.")
+            return None
+        return entry.get('value')
+
+    def set(self, key: str, value: Any) -> None:
+        """Stores `value` under `key`, writing to a temp file first so readers never see partial JSON."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        now = time.time()
+        entry = {
+            'created_at': now,
+            'expires_at': now + self.ttl_seconds if self.ttl_seconds is not None else None,
+            'value': value,
+        }
+        path = self._path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, default=_json_default)
+        os.replace(tmp_path, path)
@@ -2,20 +2,31 @@
 Configuration and assumptions for BFC 10-K Reports.
 """
 
-def get_config():
-    """Returns the current configuration settings."""
-    return {
-        'log_level': 'INFO',
-        'baseline_data': BASELINE_DATA,
-        'growth_assumptions': GROWTH_ASSUMPTIONS,
-        'market_parameters': {
-            'market_size': MARKET_SIZE,
-            'market_share': MARKET_SHARE
-        }
-    }
+import logging
+import warnings
+from dataclasses import dataclass, fields
+from types import MappingProxyType
+from typing import Any, Final, Mapping, Union
+
+logger = logging.getLogger(__name__)
+
+def get_config() -> Mapping[str, Any]:
+    """
+    Returns the current configuration settings.
+
+    Deprecated: import the module constants (BASELINE_DATA, GROWTH_ASSUMPTIONS,
+    MARKET_SIZE, MARKET_SHARE) directly. The mapping is built once at import
+    (`_CONFIG` below) and is read-only at every level.
+    """
+    warnings.warn(
+        "get_config() is deprecated; import the constants from src.core.config directly.",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    return _CONFIG
 
 # Baseline financial data from the 2018 10-K
-BASELINE_DATA = {
+BASELINE_DATA: Final = MappingProxyType({
     'assets': 7265,      # in millions USD
     'liabilities': 3794, # in millions USD
     'equity': 3471,      # in millions USD
@@ -24,54 +35,172 @@ BASELINE_DATA = {
     'ebitda_margin': 0.20,  # EBITDA/Revenue
     'net_income': 400,   # assumed net income in millions USD
     'r_and_d_spend': 200,  # assumed R&D spend in millions USD
-}
+})
 
 # Market parameters and growth assumptions
 MARKET_SIZE = 52_000  # in millions USD
 MARKET_SHARE = 7      # percent
 
-# Strategic growth assumptions
-GROWTH_ASSUMPTIONS = {
-    'one_year': {
+# Strategic growth assumptions (read-only; GROWTH_TIMEFRAMES below is the typed, attribute-access view)
+GROWTH_ASSUMPTIONS: Final = MappingProxyType({
+    'one_year': MappingProxyType({
         'revenue_growth_pct': 5,       # modest growth due to initial international and digital adoption
         'asset_growth_pct': 3,
         'liability_growth_pct': 2,
         'equity_growth_pct': 6,
         'ebitda_margin_improvement': 0.5,  # percentage points improvement
         'r_and_d_increase': 10.0          # percentage increase
-    },
-    'five_year': {
+    }),
+    'five_year': MappingProxyType({
         'cumulative_revenue_growth_pct': 20,  # cumulative growth over 5 years
         'asset_growth_pct': 15,
         'liability_growth_pct': 10,
         'equity_growth_pct': 25,
         'ebitda_margin_improvement': 2.0,    # percentage points improvement
         'r_and_d_increase': 50.0            # percentage increase
-    },
-    'ten_year': {
+    }),
+    'ten_year': MappingProxyType({
         'cumulative_revenue_growth_pct': 40,  # cumulative growth over 10 years
         'asset_growth_pct': 30,
         'liability_growth_pct': 20,
         'equity_growth_pct': 50,
         'ebitda_margin_improvement': 4.0,    # percentage points improvement
         'r_and_d_increase': 100.0           # percentage increase
-    }
-}
+    }),
+})
 
 # CAGR ranges for new markets (from case study)
-MARKET_CAGR = {
+MARKET_CAGR = MappingProxyType({
     'UK': (3.2, 8.0),      # in percent per year
     'Germany': (1.3, 4.0)   # in percent per year
-}
+})
 
 # Digital transformation assumptions
-DIGITAL_IMPACT = {
+DIGITAL_IMPACT = MappingProxyType({
     'magic_mirror_launch': True,
     'early_adoption_rate': 0.1,  # 10% adoption in early stage
-}
+})
 
 # Risk sensitivity assumptions (sensitivity analysis margins in percent)
-SENSITIVITY = {
+SENSITIVITY = MappingProxyType({
     'consumer_confidence_change': 1,   # 1% change could affect net sales
     'international_growth_variation': 2,  # 2-3% swing in international growth may affect margins
-}
+})
+
+# Settings returned by the deprecated get_config(); the nested mappings are the read-only constants above
+_CONFIG: Final = MappingProxyType({
+    'log_level': 'INFO',
+    'baseline_data': BASELINE_DATA,
+    'growth_assumptions': GROWTH_ASSUMPTIONS,
+    'market_parameters': MappingProxyType({
+        'market_size': MARKET_SIZE,
+        'market_share': MARKET_SHARE
+    })
+})
+
+# On-disk cache for projections and generated report paths (see src/core/cache.py)
+CACHE_DIR = '.cache'
+CACHE_TTL_SECONDS = 24 * 60 * 60  # entries older than a day are recomputed
+
+# --- Derived views of the assumptions above ---
+# Projection horizons
+TIMEFRAMES = ('one_year', 'five_year', 'ten_year')
+# Display labels for log/summary output
+TIMEFRAME_LABELS = {'one_year': 'One Year', 'five_year': 'Five Year', 'ten_year': 'Ten Year'}
+# Balance-sheet fields projected by PROJECTIONS
+PROJECTION_FIELDS = ('revenue', 'assets', 'liabilities', 'equity')
+
+def _growth_row(timeframe, assumptions):
+    """Growth percentages for one timeframe, ordered as PROJECTION_FIELDS."""
+    # One-year revenue growth is stored under a different key than the cumulative horizons
+    revenue_key = 'revenue_growth_pct' if timeframe == 'one_year' else 'cumulative_revenue_growth_pct'
+    return [
+        assumptions.get(revenue_key, 0),
+        assumptions.get('asset_growth_pct', 0),
+        assumptions.get('liability_growth_pct', 0),
+        assumptions.get('equity_growth_pct', 0),
+    ]
+
+# Projected revenue/assets/liabilities/equity per timeframe; the inputs are constants, so this is
+# computed once at import (in plain floats, so importing config does not load NumPy). Same operations
+# as the model's balance kernel, so the figures equal calculate_10k_projections' bit for bit
+PROJECTIONS: Final = MappingProxyType({
+    timeframe: MappingProxyType({
+        field: BASELINE_DATA[field] * (1.0 + pct * 0.01)
+        for field, pct in zip(PROJECTION_FIELDS, _growth_row(timeframe, GROWTH_ASSUMPTIONS[timeframe]))
+    })
+    for timeframe in TIMEFRAMES
+})
+
+# --- Typed, read-only views of the assumptions above ---
+def safe_get_numeric(data: Mapping[str, Any], key: str, default: float = 0.0) -> float:
+    """Safely retrieves a numeric value from a dictionary, logging warnings."""
+    val = data.get(key)
+    if val is None:
+        return default
+    try:
+        return float(val) # Also accepts NumPy scalars and numeric strings
+    except (TypeError, ValueError):
+        # Lazy %-formatting: the message is only built if the record is emitted
+        logger.warning("Non-numeric value ('%s' type: %s) for key '%s'. Using default %s.", val, type(val).__name__, key, default)
+        return default
+
+@dataclass(frozen=True, slots=True)
+class Baseline:
+    """Baseline financial figures (millions USD, margins as decimals)."""
+    assets: float
+    liabilities: float
+    equity: float
+    revenue: float
+    ebitda: float
+    ebitda_margin: float
+    net_income: float
+    r_and_d_spend: float
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> 'Baseline':
+        """Builds a Baseline from a dict; missing or non-numeric fields become 0.0."""
+        return cls(**{f.name: safe_get_numeric(data, f.name) for f in fields(cls)})
+
+    @property
+    def net_margin(self) -> float:
+        """Net income / revenue; 0.0 when there is no revenue."""
+        return self.net_income / self.revenue if self.revenue != 0 else 0.0
+
+@dataclass(frozen=True, slots=True)
+class GrowthTimeframe:
+    """Growth assumptions for one projection horizon; growth percentages are cumulative over the horizon."""
+    revenue_growth_pct: float
+    asset_growth_pct: float
+    liability_growth_pct: float
+    equity_growth_pct: float
+    ebitda_margin_improvement: float  # percentage points
+    r_and_d_increase: float           # percent
+
+@dataclass(frozen=True, slots=True)
+class TimeframeProjection:
+    """Projected figures for one horizon (millions USD, margins as decimals, CAGRs in percent or an N/A reason)."""
+    projected_revenue: float
+    revenue_cagr: Union[float, str]
+    projected_ebitda: float
+    projected_ebitda_margin: float
+    ebitda_cagr: Union[float, str]
+    projected_r_and_d_spend: float
+    rnd_cagr: Union[float, str]
+    projected_net_income: float
+    projected_net_margin: float
+    net_income_cagr: Union[float, str]
+    projected_assets: float
+    projected_liabilities: float
+    projected_equity: float
+
+BASELINE: Final = Baseline(**BASELINE_DATA)
+
+GROWTH_TIMEFRAMES: Final = MappingProxyType({
+    tf: GrowthTimeframe(
+        *_growth_row(tf, GROWTH_ASSUMPTIONS[tf]),
+        ebitda_margin_improvement=GROWTH_ASSUMPTIONS[tf].get('ebitda_margin_improvement', 0),
+        r_and_d_increase=GROWTH_ASSUMPTIONS[tf].get('r_and_d_increase', 0),
+    )
+    for tf in TIMEFRAMES
+})
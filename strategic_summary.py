@@ -2,8 +2,10 @@
 Generates a strategic summary and recommendations for BFC based on the analysis.
 """
 
-def get_strategic_summary():
-    summary = """
+from typing import Final, Tuple
+
+# Static text, so it is built once at import and every call returns the same object
+_STRATEGIC_SUMMARY: Final[str] = """
 STRATEGIC SUMMARY & RECOMMENDATIONS:
 --------------------------------------------------
 1. Global Expansion:
@@ -33,4 +35,21 @@ IMPLEMENTATION TIMELINE:
    • Mid-term (3-5 years): Consolidate market positions and refine product offerings.
    • Long-term (5-10 years): Establish BFC as a global industry leader with sustained revenue growth and premium consumer experiences.
     """
-    return summary
+
+def get_strategic_summary() -> str:
+    """Returns the strategic summary and recommendations text."""
+    return _STRATEGIC_SUMMARY
+
+# UTF-8 encoding of the summary, for writers that take bytes (binary files, sockets)
+_STRATEGIC_SUMMARY_UTF8: Final[bytes] = _STRATEGIC_SUMMARY.encode('utf-8')
+
+def get_strategic_summary_bytes() -> bytes:
+    """Returns the strategic summary encoded as UTF-8, encoded once at import."""
+    return _STRATEGIC_SUMMARY_UTF8
+
+# The summary split into lines, for consumers that emit it line by line
+_STRATEGIC_SUMMARY_LINES: Final[Tuple[str, ...]] = tuple(_STRATEGIC_SUMMARY.splitlines())
+
+def get_strategic_summary_lines() -> Tuple[str, ...]:
+    """Returns the strategic summary as a tuple of lines, split once at import."""
+    return _STRATEGIC_SUMMARY_LINES